@@ -62,6 +62,19 @@ class Config:
     PROCESSED_DATA_DIR = os.path.expanduser("~/Documents/hvacscraper") 
     LOGS_DIR = "logs"
     
+    # Browser cookies/localStorage saved after a browser login and restored while fresh
+    STORAGE_STATE_FILE = os.path.join(DATA_DIR, "bidnet_storage_state.json")
+    STORAGE_STATE_MAX_AGE = 86400  # 24 hours, same as the saved requests cookies
+    
+    # Write full search result pages to DATA_DIR as .html.gz for selector debugging
+    DEBUG_DUMP_HTML = os.getenv("BIDNET_DEBUG_DUMP_HTML", "").lower() in ("1", "true", "yes")
+    
+    # Keep each result row's HTML (first 1000 chars) on the contract dict as raw_html
+    DEBUG_STORE_RAW_HTML = os.getenv("BIDNET_DEBUG_STORE_RAW_HTML", "").lower() in ("1", "true", "yes")
+    
+    # Last-resort result detection from repeated div classes when no row/table selector matches
+    ALLOW_DIV_PATTERN_FALLBACK = os.getenv("BIDNET_ALLOW_DIV_PATTERN_FALLBACK", "").lower() in ("1", "true", "yes")
+    
     # Download settings
     MAX_PDF_SIZE_MB = 200
     DOWNLOAD_TIMEOUT = 300  # 5 minutes
@@ -70,5 +83,8 @@ class Config:
     BROWSER_SETTINGS = {
         "headless": False,  # Set to False for troubleshooting
         "window_size": (1920, 1080),
-        "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        # Resource types the search browser never downloads; stylesheets stay since
+        # element visibility checks depend on them
+        "blocked_resource_types": ("image", "font", "media")
     }
\ No newline at end of file
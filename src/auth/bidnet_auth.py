@@ -6,12 +6,26 @@ from pathlib import Path
 from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import Config
 
 class BidNetAuthenticator:
     def __init__(self):
         self.session = requests.Session()
+        
+        # Pooled keep-alive connections to BidNet for the cookie check, login and every
+        # search request made through this session; transient errors are retried
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': 'gzip, deflate'})
+        
         self.page = None
         self.browser = None
         self.context = None
@@ -1,8 +1,11 @@
 import os
-from sqlalchemy import create_engine
+import logging
+from sqlalchemy import create_engine, exc, inspect, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
-from .models import Base
+from .models import Base, ProcessingStatus
+
+logger = logging.getLogger(__name__)
 
 class DatabaseManager:
     def __init__(self, db_path=None):
@@ -23,8 +26,91 @@ class DatabaseManager:
         # Create all tables
         Base.metadata.create_all(self.engine)
         
+        # create_all() skips existing tables, so add any columns/indexes introduced since
+        added_columns = self._add_missing_columns()
+        self._create_missing_indexes()
+        
+        if 'contracts.pdf_count' in added_columns:
+            self._backfill_plan_download_totals()
+        
+        # A connection keeps the schema it loaded before the new indexes existed, and
+        # SQLite then rejects ON CONFLICT targets that rely on them; start from a fresh one
+        self.engine.dispose()
+        
         # Create session factory
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # Objects stay loaded after commit so callers can keep reading them without a refetch
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine)
+    
+    def _add_missing_columns(self):
+        """Add nullable model columns that don't exist yet on an existing database
+        
+        Returns:
+            Set of "table.column" names that were added
+        """
+        inspector = inspect(self.engine)
+        added = set()
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                existing = {column['name'] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name not in existing:
+                        column_type = column.type.compile(dialect=self.engine.dialect)
+                        conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                        logger.info(f"Added column {table.name}.{column.name}")
+                        added.add(f'{table.name}.{column.name}')
+        return added
+    
+    def _create_missing_indexes(self):
+        """Create model indexes that don't exist yet on an existing database"""
+        inspector = inspect(self.engine)
+        queue_indexes = {index['name'] for index in inspector.get_indexes('processing_queue')}
+        if 'uq_processing_queue_open_task' not in queue_indexes:
+            # The unique index (and the enqueue ON CONFLICT relying on it) needs one open task per target
+            self._close_duplicate_open_tasks()
+        
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                try:
+                    index.create(self.engine, checkfirst=True)
+                except exc.IntegrityError as e:
+                    # e.g. a unique index over rows that already contain duplicates
+                    logger.warning(f"Could not create index {index.name}: {e.orig}")
+    
+    def _close_duplicate_open_tasks(self):
+        """Skip all but one open queue task per (task_type, target_id), keeping the running or oldest one"""
+        with self.engine.begin() as conn:
+            closed = conn.execute(text("""
+                UPDATE processing_queue SET
+                    status = :skipped,
+                    completed_at = CURRENT_TIMESTAMP,
+                    error_message = 'Duplicate of another open task for the same target'
+                WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, ROW_NUMBER() OVER (
+                            PARTITION BY task_type, target_id
+                            ORDER BY status = :in_progress DESC, id
+                        ) AS position
+                        FROM processing_queue
+                        WHERE status IN (:pending, :in_progress)
+                    ) WHERE position > 1
+                )
+            """), {
+                "skipped": ProcessingStatus.SKIPPED.name,
+                "pending": ProcessingStatus.PENDING.name,
+                "in_progress": ProcessingStatus.IN_PROGRESS.name
+            }).rowcount
+        if closed:
+            logger.info(f"Skipped {closed} duplicate open queue tasks")
+    
+    def _backfill_plan_download_totals(self):
+        """Seed the materialized contract download totals from existing plan_downloads"""
+        with self.engine.begin() as conn:
+            conn.execute(text("""
+                UPDATE contracts SET
+                    pdf_count = (SELECT COUNT(*) FROM plan_downloads pd WHERE pd.contract_id = contracts.id),
+                    total_pdf_size_mb = (SELECT COALESCE(SUM(file_size_mb), 0) FROM plan_downloads pd WHERE pd.contract_id = contracts.id)
+            """))
+        logger.info("Backfilled contract plan download totals")
     
     def get_session(self):
         """Get a database session"""
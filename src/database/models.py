@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Boolean, Enum, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Boolean, Enum, ForeignKey, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -99,9 +99,18 @@ class Contract(Base):
     # Raw data for debugging/reprocessing
     raw_data = Column(JSON)
     
+    # Running plan download totals, kept in step with plan_downloads so reports don't aggregate
+    pdf_count = Column(Integer, default=0)
+    total_pdf_size_mb = Column(Float, default=0.0)
+    
     # Relationships
     city_contract = relationship("CityContract", back_populates="contract", uselist=False)
     plan_downloads = relationship("PlanDownload", back_populates="contract")
+    
+    def record_plan_download(self, file_size_mb):
+        """Update the running download totals for a newly added PlanDownload"""
+        self.pdf_count = (self.pdf_count or 0) + 1
+        self.total_pdf_size_mb = (self.total_pdf_size_mb or 0.0) + (file_size_mb or 0.0)
 
 class CityContract(Base):
     __tablename__ = "city_contracts"
@@ -226,6 +235,7 @@ class ProcessingQueue(Base):
     error_message = Column(Text)
     retry_count = Column(Integer, default=0)
     max_retries = Column(Integer, default=3)
+    next_attempt_at = Column(DateTime)  # Retry backoff; NULL = eligible immediately
     
     # Configuration
     config_data = Column(JSON)  # Task-specific configuration
@@ -233,6 +243,31 @@ class ProcessingQueue(Base):
     # Manual selection support
     manually_selected = Column(Boolean, default=False)
     selected_by = Column(String(100))  # User who selected this task
+    
+    __table_args__ = (
+        # Lets "already queued?" lookups seek straight to a (task_type, target_id) pair
+        Index("ix_processing_queue_task_target", "task_type", "target_id"),
+        # At most one open (pending/in progress) task per target, so double submissions are no-ops
+        Index(
+            "uq_processing_queue_open_task", "task_type", "target_id",
+            unique=True,
+            sqlite_where=status.in_([ProcessingStatus.PENDING, ProcessingStatus.IN_PROGRESS]),
+            postgresql_where=status.in_([ProcessingStatus.PENDING, ProcessingStatus.IN_PROGRESS])
+        ),
+        # Matches the pending-queue ORDER BY so polling is a bounded range scan with no sort
+        Index(
+            "ix_processing_queue_pending", priority.desc(), next_attempt_at, created_at,
+            sqlite_where=status == ProcessingStatus.PENDING,
+            postgresql_where=status == ProcessingStatus.PENDING
+        ),
+        # cleanup_old_tasks range-deletes finished tasks by completion time; its status
+        # filter is rendered literally, since SQLite only matches an identical IN list
+        Index(
+            "ix_processing_queue_finished", completed_at,
+            sqlite_where=status.in_([ProcessingStatus.COMPLETED, ProcessingStatus.FAILED]),
+            postgresql_where=status.in_([ProcessingStatus.COMPLETED, ProcessingStatus.FAILED])
+        ),
+    )
 
 class CityPortal(Base):
     """Track portal requirements for each city"""
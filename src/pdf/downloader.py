@@ -74,6 +74,7 @@ class PDFDownloader:
                             download_date=datetime.utcnow()
                         )
                         session.add(plan_download)
+                        contract.record_plan_download(result['file_size_mb'])
                     
                 except Exception as e:
                     self.logger.error(f"Failed to download {url}: {e}")
@@ -28,7 +28,15 @@ from pathlib import Path
 from playwright.sync_api import sync_playwright
 from bs4 import BeautifulSoup
 import PyPDF2
-import pandas as pd
+from sqlalchemy import text
+from openpyxl import Workbook
+
+# Optional columnar reader for the extraction report
+try:
+    import connectorx as cx
+    CONNECTORX_AVAILABLE = True
+except ImportError:
+    CONNECTORX_AVAILABLE = False
 
 from ..database.connection import DatabaseManager
 from ..database.models import (
@@ -42,6 +50,45 @@ from ..portal.pattern_library import PortalPatternLibrary
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip when streaming the extraction report
+REPORT_CHUNK_SIZE = 5000
+
+# Resources the extractors never inspect - they only read anchors and text
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'stylesheet', 'media', 'websocket'})
+_BLOCKED_URL_FRAGMENTS = ('google-analytics', 'doubleclick', 'hotjar', 'segment.io', 'segment.com', 'facebook')
+
+def _route_documents_only(route):
+    """Playwright route handler that aborts assets and analytics beacons"""
+    request = route.request
+    # Never match tracker fragments against documents - a city page URL may contain one
+    if (request.resource_type in _BLOCKED_RESOURCE_TYPES or
+            (request.resource_type != 'document' and
+             any(fragment in request.url for fragment in _BLOCKED_URL_FRAGMENTS))):
+        route.abort()
+    else:
+        route.continue_()
+
+def _iter_arrow_rows(table):
+    """Yield row tuples from an Arrow table one record batch at a time"""
+    for batch in table.to_batches(max_chunksize=REPORT_CHUNK_SIZE):
+        yield from zip(*(column.to_pylist() for column in batch.columns))
+
+def _new_lightweight_context(browser):
+    """Create a browser context that only loads documents and scripts"""
+    context = browser.new_context()
+    context.route("**/*", _route_documents_only)
+    return context
+
+def _count_key_word_hits(html: str, key_words: frozenset) -> int:
+    """Count distinct (lowercase) key words present anywhere in an HTML page"""
+    if not key_words:
+        return 0
+    
+    # One lowered copy, then a C substring search per word: a few ms on a large page,
+    # where a case-insensitive regex over the same HTML loses CPython's literal fast search
+    content = html.lower()
+    return sum(1 for word in key_words if word in content)
+
 class MultiLayerExtractor:
     """
     Orchestrates multi-layer extraction: BidNet → City RFP → PDF
@@ -101,13 +148,12 @@ class MultiLayerExtractor:
         try:
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                context = browser.new_context()
+                context = _new_lightweight_context(browser)
                 page = context.new_page()
                 
                 # Step 1: Navigate to city website
                 try:
-                    page.goto(city_url, timeout=10000)
-                    page.wait_for_load_state('networkidle', timeout=5000)
+                    page.goto(city_url, timeout=10000, wait_until="domcontentloaded")
                 except Exception as e:
                     extraction_result['error'] = f"Failed to load city website: {str(e)}"
                     return extraction_result
@@ -123,8 +169,7 @@ class MultiLayerExtractor:
                 # Step 3: Navigate to RFP page if different from main page
                 if rfp_page_url != city_url:
                     try:
-                        page.goto(rfp_page_url, timeout=10000)
-                        page.wait_for_load_state('networkidle', timeout=5000)
+                        page.goto(rfp_page_url, timeout=10000, wait_until="domcontentloaded")
                     except Exception as e:
                         extraction_result['error'] = f"Failed to load RFP page: {str(e)}"
                         return extraction_result
@@ -203,13 +248,10 @@ class MultiLayerExtractor:
         
         # Extract key words from contract title for searching
         title_words = contract_title.lower().split()
-        key_words = [word for word in title_words if len(word) > 3][:5]  # Top 5 significant words
+        key_words = frozenset([word for word in title_words if len(word) > 3][:5])  # Top 5 significant words
         
-        # Get page content
-        page_content = page.content().lower()
-        
-        # Check if enough key words are present
-        matches = sum(1 for word in key_words if word in page_content)
+        # Check if enough key words are present (substring checks on one lowercased copy of the HTML)
+        matches = _count_key_word_hits(page.content(), key_words)
         match_ratio = matches / len(key_words) if key_words else 0
         
         # Consider it found if at least 60% of key words match
@@ -499,11 +541,11 @@ class MultiLayerExtractor:
         try:
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+                page = _new_lightweight_context(browser).new_page()
                 
                 # Navigate to contract source URL
                 if contract.source_url:
-                    page.goto(contract.source_url, timeout=10000)
+                    page.goto(contract.source_url, timeout=10000, wait_until="domcontentloaded")
                     
                     # Use stored patterns to extract additional details
                     selectors = city_platform.contract_selectors or {}
@@ -601,6 +643,7 @@ class MultiLayerExtractor:
                             text_content=text_content[:10000] if text_content else None  # Limit text size
                         )
                         session.add(download_record)
+                        contract.record_plan_download(file_size_mb)
                         self.stats['pdfs_downloaded'] += 1
                         
                         logger.debug(f"✅ Downloaded and processed: {filename}")
@@ -626,8 +669,8 @@ class MultiLayerExtractor:
         try:
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                page.goto(contract.source_url, timeout=10000)
+                page = _new_lightweight_context(browser).new_page()
+                page.goto(contract.source_url, timeout=10000, wait_until="domcontentloaded")
                 
                 # Look for PDF links
                 pdf_selectors = [
@@ -709,6 +752,26 @@ class MultiLayerExtractor:
             ) / max(self.stats['contracts_processed'], 1)
         }
     
+    def _fetch_report_rows(self, session, query: str):
+        """Return (header, row iterator) for the report query
+        
+        Uses connectorx's columnar fetch when installed and falls back to
+        streaming from a server-side cursor through SQLAlchemy.
+        """
+        database = self.db.engine.url.database
+        if CONNECTORX_AVAILABLE and database:
+            try:
+                table = cx.read_sql(f"sqlite://{os.path.abspath(database)}", query, return_type="arrow")
+                return table.column_names, _iter_arrow_rows(table)
+            except Exception as e:
+                logger.warning(f"connectorx report fetch failed, using SQLAlchemy: {e}")
+        
+        result = session.execute(
+            text(query),
+            execution_options={"stream_results": True, "yield_per": REPORT_CHUNK_SIZE}
+        )
+        return list(result.keys()), (tuple(row) for row in result)
+    
     def generate_extraction_report(self, output_dir: str = "data/reports") -> str:
         """Generate comprehensive extraction report"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -725,22 +788,28 @@ class MultiLayerExtractor:
                 c.processing_status,
                 cc.city_name,
                 cc.additional_details,
-                COUNT(pd.id) as pdf_count,
-                SUM(pd.file_size_mb) as total_pdf_size_mb
+                COALESCE(c.pdf_count, 0) as pdf_count,
+                c.total_pdf_size_mb
             FROM contracts c
             LEFT JOIN city_contracts cc ON c.id = cc.contract_id
-            LEFT JOIN plan_downloads pd ON c.id = pd.contract_id
             WHERE c.processing_status = 'completed'
-            GROUP BY c.id, c.title, c.agency, c.location, c.geographic_region, 
-                     c.processing_status, cc.city_name, cc.additional_details
             """
             
-            df = pd.read_sql(query, session.bind)
-            
             # Save report
             os.makedirs(output_dir, exist_ok=True)
             report_file = os.path.join(output_dir, f"extraction_report_{timestamp}.xlsx")
-            df.to_excel(report_file, index=False)
+            
+            # Write rows straight into a write-only workbook so the report is
+            # never materialized as a DataFrame
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet("Report")
+            
+            header, rows = self._fetch_report_rows(session, query)
+            worksheet.append(header)
+            for row in rows:
+                worksheet.append(row)
+            
+            workbook.save(report_file)
             
             logger.info(f"📊 Generated extraction report: {report_file}")
             
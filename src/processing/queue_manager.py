@@ -1,24 +1,206 @@
 import logging
+from collections import defaultdict
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, update, delete, and_, or_, case, cast, literal, null, bindparam, text, String
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from ..database.models import ProcessingQueue, ProcessingStatus, Contract, CityContract
 from ..database.connection import db_manager
 
+logger = logging.getLogger(__name__)
+
+# Status members used on the hot paths
+_PENDING = ProcessingStatus.PENDING
+_IN_PROGRESS = ProcessingStatus.IN_PROGRESS
+_COMPLETED = ProcessingStatus.COMPLETED
+_FAILED = ProcessingStatus.FAILED
+
+# Retry priority bumps stop here
+MAX_PRIORITY = 100
+
+# Rows deleted per transaction by cleanup_old_tasks
+CLEANUP_BATCH_SIZE = 1000
+
+# Hot-path statements are built once with named bind parameters so each call
+# reuses the same compiled SQL from SQLAlchemy's statement cache
+_PENDING_TASKS = select(ProcessingQueue).where(
+    ProcessingQueue.status == _PENDING,
+    or_(
+        ProcessingQueue.next_attempt_at.is_(None),
+        ProcessingQueue.next_attempt_at <= bindparam("now")
+    )
+).order_by(
+    ProcessingQueue.priority.desc(),
+    ProcessingQueue.next_attempt_at.asc().nullsfirst(),
+    ProcessingQueue.created_at.asc()
+)
+_PENDING_TASKS_BY_TYPE = _PENDING_TASKS.where(ProcessingQueue.task_type == bindparam("task_type_filter"))
+
+def _claim_statement(pending_tasks):
+    """Atomically flip the next pending tasks to in-progress and return them"""
+    next_ids = pending_tasks.with_only_columns(ProcessingQueue.id).limit(
+        bindparam("limit")
+    ).with_for_update(skip_locked=True)  # Postgres: skip rows other workers hold; no-op on SQLite
+    return update(ProcessingQueue).where(
+        ProcessingQueue.id.in_(next_ids.scalar_subquery())
+    ).values(
+        status=_IN_PROGRESS,
+        started_at=bindparam("now")
+    ).returning(ProcessingQueue)
+
+_CLAIM_TASKS = _claim_statement(_PENDING_TASKS)
+_CLAIM_TASKS_BY_TYPE = _claim_statement(_PENDING_TASKS_BY_TYPE)
+
+def _literal_predicate(clause):
+    """
+    Render a predicate with its values inlined
+    
+    SQLite only uses a partial index when the query repeats its WHERE terms,
+    and a bound IN (?, ?) never matches a literal one.
+    """
+    return text(str(clause.compile(
+        dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}
+    )))
+
+# Tasks that haven't finished yet
+_OPEN_STATUSES = [_PENDING, _IN_PROGRESS]
+
+# Open tasks are unique per (task_type, target_id) via uq_processing_queue_open_task;
+# conflicting inserts are skipped and return no row
+_OPEN_TASK_WHERE = ProcessingQueue.status.in_(_OPEN_STATUSES)
+_ENQUEUE = sqlite_insert(ProcessingQueue).on_conflict_do_nothing(
+    index_elements=[ProcessingQueue.task_type, ProcessingQueue.target_id],
+    index_where=_literal_predicate(_OPEN_TASK_WHERE)
+).returning(ProcessingQueue.id)
+_OPEN_TASK_ID = select(ProcessingQueue.id).where(
+    ProcessingQueue.task_type == bindparam("task_type"),
+    ProcessingQueue.target_id == bindparam("target_id"),
+    _OPEN_TASK_WHERE
+)
+
+# State transitions are single UPDATE ... RETURNING statements (one round-trip each).
+# Only open tasks can transition.
+_STATUS_TYPE = ProcessingQueue.status.type
+
+_MARK_STARTED = update(ProcessingQueue).where(
+    ProcessingQueue.id == bindparam("queue_id"),
+    ProcessingQueue.status == _PENDING
+).values(
+    status=_IN_PROGRESS,
+    started_at=bindparam("started_at")
+)
+
+_MARK_COMPLETED = update(ProcessingQueue).where(
+    ProcessingQueue.id == bindparam("queue_id"),
+    _OPEN_TASK_WHERE
+).values(
+    status=_COMPLETED,
+    completed_at=bindparam("completed_at")
+)
+
+# Reset to pending while retries remain, otherwise fail permanently. Retries get
+# a priority bump plus a short exponential backoff (2^retry_count seconds) so they
+# run ahead of older work in their class instead of waiting behind the whole backlog.
+_WILL_RETRY = ProcessingQueue.retry_count + 1 <= ProcessingQueue.max_retries
+_RETRY_BACKOFF = func.datetime(
+    bindparam("failed_at"),
+    '+' + cast(literal(1).op('<<')(ProcessingQueue.retry_count + 1), String) + ' seconds'
+)
+_MARK_FAILED = update(ProcessingQueue).where(
+    ProcessingQueue.id == bindparam("queue_id"),
+    _OPEN_TASK_WHERE
+).values(
+    error_message=bindparam("error_message"),
+    retry_count=ProcessingQueue.retry_count + 1,
+    status=case(
+        (_WILL_RETRY, literal(_PENDING, _STATUS_TYPE)),
+        else_=literal(_FAILED, _STATUS_TYPE)
+    ),
+    started_at=case((_WILL_RETRY, null()), else_=ProcessingQueue.started_at),
+    next_attempt_at=case((_WILL_RETRY, _RETRY_BACKOFF), else_=null()),
+    priority=case(
+        (and_(_WILL_RETRY, ProcessingQueue.priority < MAX_PRIORITY), ProcessingQueue.priority + 1),
+        else_=ProcessingQueue.priority
+    )
+).returning(
+    ProcessingQueue.status,
+    ProcessingQueue.retry_count,
+    ProcessingQueue.max_retries
+)
+
+# Correlated NOT EXISTS probe; target_id stays uncast so ix_processing_queue_task_target
+# serves it as an index seek with early exit
+_ALREADY_QUEUED_FOR_AI = select(ProcessingQueue.id).where(
+    ProcessingQueue.task_type == 'ai_analysis',
+    ProcessingQueue.target_id == cast(Contract.id, String)
+).exists()
+# Only the columns the selection UI shows, so no ORM objects are hydrated
+_MANUAL_SELECTION_CANDIDATES = select(
+    Contract.id,
+    Contract.title,
+    Contract.agency,
+    Contract.location,
+    Contract.estimated_value,
+    Contract.hvac_relevance_score,
+    Contract.matching_keywords,
+    Contract.discovered_at,
+    Contract.source_url
+).where(
+    Contract.processing_status == bindparam("status"),
+    Contract.hvac_relevance_score > 0,
+    Contract.raw_data["in_target_region"].as_boolean() == True,  # Set by HybridScraper._save_contracts_to_db
+    ~_ALREADY_QUEUED_FOR_AI  # Not already queued
+).order_by(
+    Contract.hvac_relevance_score.desc(),
+    Contract.discovered_at.desc()
+).limit(bindparam("limit"))
+
+_QUEUE_STATUS_COUNTS = select(
+    ProcessingQueue.status,
+    ProcessingQueue.task_type,
+    func.count(ProcessingQueue.id),
+    func.sum(case((ProcessingQueue.manually_selected == True, 1), else_=0))
+).group_by(
+    ProcessingQueue.status,
+    ProcessingQueue.task_type
+)
+
+# Oldest finished tasks first, one bounded batch per transaction; the literal status
+# filter lets the subquery walk ix_processing_queue_finished instead of scanning the queue
+_DELETE_FINISHED_BATCH = delete(ProcessingQueue).where(
+    ProcessingQueue.id.in_(
+        select(ProcessingQueue.id).where(
+            _literal_predicate(ProcessingQueue.status.in_([_COMPLETED, _FAILED])),
+            ProcessingQueue.completed_at < bindparam("cutoff")
+        ).order_by(ProcessingQueue.completed_at).limit(CLEANUP_BATCH_SIZE)
+    )
+)
+
 class QueueManager:
     """
     Manages the processing queue for batch operations and manual selection
     """
     
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+    
+    @contextmanager
+    def _session(self, session: Optional[Session] = None):
+        """Use the caller's session (and transaction) if given, otherwise open a new one"""
+        if session is not None:
+            yield session
+        else:
+            with db_manager.get_session() as new_session:
+                yield new_session
     
     def add_to_queue(self, task_type: str, target_id: str, 
                     config_data: Dict[str, Any] = None,
                     priority: int = 0, manually_selected: bool = False,
-                    selected_by: str = None) -> int:
+                    selected_by: str = None, session: Session = None) -> int:
         """
         Add a task to the processing queue
         
@@ -29,92 +211,143 @@ class QueueManager:
             priority: Priority level (higher = more important)
             manually_selected: Whether this was manually selected by user
             selected_by: Username who selected this task
+            session: Optional caller-managed session; the caller commits
             
         Returns:
             Queue item ID
         """
-        with db_manager.get_session() as session:
-            queue_item = ProcessingQueue(
-                task_type=task_type,
-                target_id=target_id,
-                config_data=config_data or {},
-                priority=priority,
-                manually_selected=manually_selected,
-                selected_by=selected_by,
-                status=ProcessingStatus.PENDING
-            )
-            
-            session.add(queue_item)
-            session.commit()
-            
-            self.logger.info(f"Added to queue: {task_type} for {target_id} (priority: {priority})")
-            return queue_item.id
+        with self._session(session) as active_session:
+            # Idempotent enqueue: an open task for the same target is left as-is
+            queue_id = active_session.execute(_ENQUEUE, {
+                "task_type": task_type,
+                "target_id": target_id,
+                "config_data": config_data or {},
+                "priority": priority,
+                "manually_selected": manually_selected,
+                "selected_by": selected_by,
+                "status": _PENDING
+            }).scalar()
+            
+            if queue_id is None:
+                queue_id = active_session.execute(_OPEN_TASK_ID, {
+                    "task_type": task_type,
+                    "target_id": target_id
+                }).scalar()
+                self.logger.info("Already queued: %s for %s (id: %s)", task_type, target_id, queue_id)
+                return queue_id
+            
+            if session is None:
+                active_session.commit()
+            
+            self.logger.info("Added to queue: %s for %s (priority: %s)", task_type, target_id, priority)
+            return queue_id
     
-    def get_pending_tasks(self, task_type: str = None, limit: int = 10) -> List[ProcessingQueue]:
+    def get_pending_tasks(self, task_type: str = None, limit: int = 10,
+                          session: Session = None) -> List[ProcessingQueue]:
         """Get pending tasks from the queue"""
-        with db_manager.get_session() as session:
-            query = session.query(ProcessingQueue).filter(
-                ProcessingQueue.status == ProcessingStatus.PENDING
-            )
+        with self._session(session) as active_session:
+            # Ordered by priority (desc), then retry time, then created_at (asc)
+            # Retrying tasks are skipped until their backoff has elapsed
+            params = {"now": datetime.utcnow()}
+            if task_type:
+                query = _PENDING_TASKS_BY_TYPE
+                params["task_type_filter"] = task_type
+            else:
+                query = _PENDING_TASKS
+            
+            if limit:
+                query = query.limit(bindparam("limit"))
+                params["limit"] = limit
+            
+            return active_session.execute(query, params).scalars().all()
+    
+    def claim_tasks(self, limit: int = 10, task_type: str = None,
+                    session: Session = None) -> List[ProcessingQueue]:
+        """
+        Claim pending tasks for this worker
+        
+        Selects the next pending tasks (same ordering as get_pending_tasks) and
+        marks them in progress in a single UPDATE, so concurrent workers never
+        receive the same task.
+        
+        Args:
+            limit: Maximum number of tasks to claim
+            task_type: Only claim tasks of this type
+            session: Optional caller-managed session; the caller commits
             
+        Returns:
+            Claimed tasks, highest priority first
+        """
+        with self._session(session) as active_session:
+            params = {"now": datetime.utcnow(), "limit": limit}
             if task_type:
-                query = query.filter(ProcessingQueue.task_type == task_type)
+                query = _CLAIM_TASKS_BY_TYPE
+                params["task_type_filter"] = task_type
+            else:
+                query = _CLAIM_TASKS
             
-            # Order by priority (desc) then created_at (asc)
-            query = query.order_by(
-                ProcessingQueue.priority.desc(),
-                ProcessingQueue.created_at.asc()
-            )
+            tasks = active_session.execute(query, params).scalars().all()
             
-            if limit:
-                query = query.limit(limit)
+            if session is None:
+                active_session.commit()
             
-            return query.all()
+            # RETURNING doesn't guarantee order; mirror the ORDER BY (next_attempt_at nulls first)
+            tasks.sort(key=lambda task: (
+                -task.priority,
+                task.next_attempt_at is not None,
+                task.next_attempt_at or datetime.min,
+                task.created_at
+            ))
+            return tasks
     
-    def mark_task_started(self, queue_id: int) -> bool:
-        """Mark a task as started"""
-        with db_manager.get_session() as session:
-            task = session.query(ProcessingQueue).filter(ProcessingQueue.id == queue_id).first()
-            if task:
-                task.status = ProcessingStatus.IN_PROGRESS
-                task.started_at = datetime.utcnow()
-                session.commit()
-                return True
-            return False
+    def mark_task_started(self, queue_id: int, session: Session = None) -> bool:
+        """Mark a task as started (workers should prefer claim_tasks, which can't race)"""
+        with self._session(session) as active_session:
+            updated = active_session.execute(_MARK_STARTED, {
+                "queue_id": queue_id,
+                "started_at": datetime.utcnow()
+            }).rowcount
+            if session is None:
+                active_session.commit()
+            return updated > 0
     
-    def mark_task_completed(self, queue_id: int) -> bool:
+    def mark_task_completed(self, queue_id: int, session: Session = None) -> bool:
         """Mark a task as completed"""
-        with db_manager.get_session() as session:
-            task = session.query(ProcessingQueue).filter(ProcessingQueue.id == queue_id).first()
-            if task:
-                task.status = ProcessingStatus.COMPLETED
-                task.completed_at = datetime.utcnow()
-                session.commit()
-                return True
-            return False
+        with self._session(session) as active_session:
+            updated = active_session.execute(_MARK_COMPLETED, {
+                "queue_id": queue_id,
+                "completed_at": datetime.utcnow()
+            }).rowcount
+            if session is None:
+                active_session.commit()
+            return updated > 0
     
-    def mark_task_failed(self, queue_id: int, error_message: str) -> bool:
+    def mark_task_failed(self, queue_id: int, error_message: str,
+                         session: Session = None) -> bool:
         """Mark a task as failed"""
-        with db_manager.get_session() as session:
-            task = session.query(ProcessingQueue).filter(ProcessingQueue.id == queue_id).first()
-            if task:
-                task.status = ProcessingStatus.FAILED
-                task.error_message = error_message
-                task.retry_count += 1
-                
-                # If we haven't exceeded max retries, reset to pending
-                if task.retry_count <= task.max_retries:
-                    task.status = ProcessingStatus.PENDING
-                    task.started_at = None
-                    self.logger.info(f"Task {queue_id} failed, will retry ({task.retry_count}/{task.max_retries})")
-                else:
-                    self.logger.error(f"Task {queue_id} failed permanently after {task.retry_count} retries")
-                
-                session.commit()
-                return True
-            return False
+        with self._session(session) as active_session:
+            # Retry bookkeeping and the pending/failed decision happen in the UPDATE itself
+            row = active_session.execute(_MARK_FAILED, {
+                "queue_id": queue_id,
+                "error_message": error_message,
+                "failed_at": datetime.utcnow()
+            }).first()
+            if session is None:
+                active_session.commit()
+            
+            if row is None:
+                return False
+            
+            status, retry_count, max_retries = row
+            if status == _PENDING:
+                self.logger.info("Task %s failed, will retry (%s/%s)", queue_id, retry_count, max_retries)
+            else:
+                self.logger.error("Task %s failed permanently after %s retries", queue_id, retry_count)
+            
+            return True
     
-    def get_manual_selection_candidates(self, limit: int = 20) -> List[Dict[str, Any]]:
+    def get_manual_selection_candidates(self, limit: int = 20,
+                                        session: Session = None) -> List[Dict[str, Any]]:
         """
         Get contracts that are good candidates for manual AI processing selection
         
@@ -123,120 +356,92 @@ class QueueManager:
         2. Have high HVAC relevance
         3. Haven't been processed yet
         """
-        with db_manager.get_session() as session:
+        with self._session(session) as active_session:
             # Get contracts that haven't been queued for AI analysis yet
-            subquery = session.query(ProcessingQueue.target_id).filter(
-                ProcessingQueue.task_type == 'ai_analysis'
-            ).subquery()
-            
-            contracts = session.query(Contract).filter(
-                Contract.processing_status == ProcessingStatus.PENDING,
-                Contract.hvac_relevance_score > 0,
-                Contract.in_target_region == True,
-                ~Contract.id.in_(subquery)  # Not already queued
-            ).order_by(
-                Contract.hvac_relevance_score.desc(),
-                Contract.discovered_at.desc()
-            ).limit(limit).all()
-            
-            # Convert to dictionaries with additional info
-            candidates = []
-            for contract in contracts:
-                candidates.append({
-                    'id': contract.id,
-                    'title': contract.title,
-                    'agency': contract.agency,
-                    'location': contract.location,
-                    'estimated_value': contract.estimated_value,
-                    'hvac_relevance_score': contract.hvac_relevance_score,
-                    'matching_keywords': contract.matching_keywords,
-                    'discovered_at': contract.discovered_at.isoformat(),
-                    'source_url': contract.source_url
-                })
-            
-            return candidates
+            rows = active_session.execute(_MANUAL_SELECTION_CANDIDATES, {
+                "status": _PENDING,
+                "limit": limit
+            }).mappings().all()
+            
+            return [dict(row, discovered_at=row['discovered_at'].isoformat()) for row in rows]
     
     def queue_selected_contracts_for_ai(self, contract_ids: List[int], 
-                                      selected_by: str) -> int:
+                                      selected_by: str, session: Session = None) -> int:
         """
         Queue manually selected contracts for AI processing
         
         Args:
             contract_ids: List of contract IDs to process
             selected_by: Username who made the selection
+            session: Optional caller-managed session; the caller commits
             
         Returns:
             Number of contracts queued
         """
-        queued_count = 0
+        if not contract_ids:
+            return 0
+        
+        # High priority since manually selected; one multi-row INSERT and one commit
+        rows = [
+            {
+                "task_type": "ai_analysis",
+                "target_id": str(contract_id),
+                "config_data": {"contract_id": contract_id},
+                "priority": 10,
+                "manually_selected": True,
+                "selected_by": selected_by,
+                "status": _PENDING
+            }
+            for contract_id in contract_ids
+        ]
         
-        for contract_id in contract_ids:
-            # Add to queue with high priority since manually selected
-            self.add_to_queue(
-                task_type="ai_analysis",
-                target_id=str(contract_id),
-                config_data={"contract_id": contract_id},
-                priority=10,  # High priority for manual selections
-                manually_selected=True,
-                selected_by=selected_by
-            )
-            queued_count += 1
+        with self._session(session) as active_session:
+            queued_count = len(active_session.execute(_ENQUEUE, rows).all())
+            if session is None:
+                active_session.commit()
         
-        self.logger.info(f"Queued {queued_count} contracts for AI processing (selected by {selected_by})")
+        self.logger.info("Queued %s contracts for AI processing (selected by %s)", queued_count, selected_by)
         return queued_count
     
-    def get_queue_status(self) -> Dict[str, Any]:
+    def get_queue_status(self, session: Session = None) -> Dict[str, Any]:
         """Get overall queue status"""
-        with db_manager.get_session() as session:
-            status_counts = session.query(
-                ProcessingQueue.status,
-                ProcessingQueue.task_type,
-                func.count(ProcessingQueue.id)
-            ).group_by(
-                ProcessingQueue.status,
-                ProcessingQueue.task_type
-            ).all()
+        with self._session(session) as active_session:
+            # One grouped query: per (status, task_type) counts with their manual-selection counts
+            status_counts = active_session.execute(_QUEUE_STATUS_COUNTS).all()
             
             # Organize results
-            result = {
-                "total_tasks": 0,
-                "by_status": {},
-                "by_type": {},
-                "manual_selections": 0
-            }
+            total_tasks = 0
+            manual_selections = 0
+            by_status = defaultdict(int)
+            by_type = defaultdict(lambda: defaultdict(int))
             
-            for status, task_type, count in status_counts:
-                result["total_tasks"] += count
-                
-                if status.value not in result["by_status"]:
-                    result["by_status"][status.value] = 0
-                result["by_status"][status.value] += count
-                
-                if task_type not in result["by_type"]:
-                    result["by_type"][task_type] = {}
-                if status.value not in result["by_type"][task_type]:
-                    result["by_type"][task_type][status.value] = 0
-                result["by_type"][task_type][status.value] += count
-            
-            # Count manual selections
-            manual_count = session.query(ProcessingQueue).filter(
-                ProcessingQueue.manually_selected == True
-            ).count()
-            result["manual_selections"] = manual_count
-            
-            return result
+            for status, task_type, count, manual_count in status_counts:
+                status_value = status.value
+                total_tasks += count
+                manual_selections += manual_count
+                by_status[status_value] += count
+                by_type[task_type][status_value] += count
+            
+            return {
+                "total_tasks": total_tasks,
+                "by_status": dict(by_status),
+                "by_type": {task_type: dict(counts) for task_type, counts in by_type.items()},
+                "manual_selections": manual_selections
+            }
     
     def cleanup_old_tasks(self, days_old: int = 7) -> int:
-        """Clean up old completed/failed tasks"""
+        """Clean up old completed/failed tasks in small batches so workers aren't blocked"""
+        cutoff_date = datetime.utcnow() - timedelta(days=days_old)
+        deleted = 0
+        
         with db_manager.get_session() as session:
-            cutoff_date = datetime.utcnow() - timedelta(days=days_old)
-            
-            deleted = session.query(ProcessingQueue).filter(
-                ProcessingQueue.status.in_([ProcessingStatus.COMPLETED, ProcessingStatus.FAILED]),
-                ProcessingQueue.completed_at < cutoff_date
-            ).delete()
-            
-            session.commit()
+            while True:
+                batch = session.execute(_DELETE_FINISHED_BATCH, {"cutoff": cutoff_date}).rowcount
+                session.commit()
+                deleted += batch
+                
+                if batch < CLEANUP_BATCH_SIZE:
+                    break
             
-            self.logger.info(f"Cleaned up {deleted} old tasks")
+            self.logger.info("Cleaned up %s old tasks", deleted)
             return deleted
\ No newline at end of file
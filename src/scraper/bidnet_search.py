@@ -1,11 +1,21 @@
+import csv
+import gzip
+import hashlib
 import logging
+import multiprocessing
+import os
 import time
 import re
-from typing import List, Dict, Any, Optional
-from urllib.parse import urlencode, urlparse, parse_qs
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache, partial
+from itertools import islice
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from urllib.parse import urlencode, urljoin, urlparse, parse_qs
 import requests
 from bs4 import BeautifulSoup
-import pandas as pd
+import soupsieve as sv
 from tqdm import tqdm
 
 from config import Config
@@ -13,6 +23,411 @@ from src.auth.bidnet_auth import BidNetAuthenticator
 
 from playwright.sync_api import sync_playwright
 
+# Optional C-backed parser used to locate result rows without building a full soup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Optional Aho-Corasick matcher: finds every keyword in a single pass over the text
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional streaming Excel writer; openpyxl (through pandas) is the fallback
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Length of the raw_html preview exported to Excel (and kept on filtered contracts)
+RAW_HTML_PREVIEW_CHARS = 300
+
+# Contract field -> (Excel column name, default when missing); None means derived in code
+EXCEL_COLUMNS = {
+    'title': ('Title', 'No title'),
+    'agency': ('Agency', 'Unknown'),
+    'location': ('Location', 'Unknown'),
+    'dates': ('Dates', 'No dates found'),
+    'estimated_value': ('Estimated_Value', 'Not specified'),
+    'url': ('URL', 'No URL'),
+    'search_keyword': ('Search_Keyword', ''),
+    'hvac_relevance_score': ('HVAC_Relevance_Score', 0),
+    'matching_keywords': ('Matching_Keywords', None),
+    'id': ('Contract_ID', ''),
+    'raw_html': ('Raw_HTML_Preview', None),
+}
+
+# Selectors that only match BidNet's own result rows (not generic page structure)
+BIDNET_ROW_SELECTORS = (
+    'tr[class*="mets-table-row"]',
+    'tr.mets-table-row',
+    'tr.mets-table-row.odd, tr.mets-table-row.even',
+)
+
+# Per selector: "visible", "hidden" (no visible match) or "unsupported" by querySelectorAll;
+# stops after the first visible one
+VISIBLE_SELECTOR_STATES_JS = """
+(selectors) => {
+    const states = [];
+    for (const selector of selectors) {
+        let state;
+        try {
+            const visible = Array.from(document.querySelectorAll(selector)).some(
+                el => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden'
+            );
+            state = visible ? 'visible' : 'hidden';
+        } catch (e) {
+            state = 'unsupported';
+        }
+        states.push(state);
+        if (state === 'visible') break;
+    }
+    return states;
+}
+"""
+
+# Outer HTML of the first BidNet row selector that matches, plus row counts for logging;
+# null when none match
+RESULT_ROWS_JS = """
+([selectors, limit]) => {
+    for (const selector of selectors) {
+        const rows = document.querySelectorAll(selector);
+        if (rows.length) {
+            return {
+                selector: selector,
+                total: rows.length,
+                odd: document.querySelectorAll('tr.mets-table-row.odd').length,
+                even: document.querySelectorAll('tr.mets-table-row.even').length,
+                rows: Array.from(rows).slice(0, limit).map(row => row.outerHTML),
+            };
+        }
+    }
+    return null;
+}
+"""
+
+# Batches at least this large are filtered with pandas string ops
+VECTORIZED_FILTER_MIN_CONTRACTS = 20
+
+# Batches at least this large are split across worker processes in chunks of this size
+PARALLEL_FILTER_MIN_CONTRACTS = 5000
+PARALLEL_FILTER_CHUNK_SIZE = 500
+
+# BidNet's message on an empty (but valid) results page
+NO_RESULTS_TEXT_PATTERN = re.compile(r'no results match your criteria', re.IGNORECASE)
+
+# Text that marks page chrome rather than a contract title
+GENERIC_TEXT_PATTERN = re.compile(r'search|result|page|filter|sort', re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def _normalize_keywords(keywords: Tuple[str, ...]):
+    """
+    Lowercase and dedupe a keyword list (dropping empty entries) and compile its alternation
+    
+    Cached per keyword tuple, so every searcher in the process shares the work.
+    
+    Returns:
+        Tuple of (lowercased keywords in config order, compiled alternation that
+        never matches when there are no keywords)
+    """
+    normalized = tuple(dict.fromkeys(kw.lower() for kw in keywords if kw))
+    if not normalized:
+        return normalized, re.compile(r'(?!)')
+    return normalized, re.compile('|'.join(map(re.escape, normalized)))
+
+@lru_cache(maxsize=None)
+def _compile_field_selectors(selectors: Tuple[str, ...]):
+    """
+    Compile a field's selector list once for _extract_text_by_selectors
+    
+    Returns:
+        Tuple of (compound pattern matching any selector, per-selector patterns in
+        priority order); selectors soupsieve rejects are dropped
+    """
+    valid = []
+    for selector in selectors:
+        try:
+            valid.append((selector, sv.compile(selector)))
+        except sv.SelectorSyntaxError:
+            logging.getLogger(__name__).debug(f"Skipping invalid field selector: {selector}")
+    compound = sv.compile(', '.join(selector for selector, _ in valid)) if valid else None
+    return compound, tuple(pattern for _, pattern in valid)
+
+@lru_cache(maxsize=None)
+def _keyword_automaton(keywords: Tuple[str, ...]):
+    """Aho-Corasick automaton over a normalized keyword tuple, or None if unavailable/empty"""
+    if not AHOCORASICK_AVAILABLE or not keywords:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+def _match_keywords(text: str, keywords: Tuple[str, ...], pattern) -> List[str]:
+    """
+    Keywords (from _normalize_keywords) occurring as substrings of lowercased text
+    
+    The compiled alternation rejects texts with no hits in one scan. Texts that hit
+    anything are scanned once more by the Aho-Corasick automaton when installed,
+    otherwise checked keyword by keyword; matches come back in keyword order.
+    Results are memoized per text, so a listing seen under several search keywords
+    is only matched once.
+    """
+    return list(_cached_keyword_hits(text, keywords, pattern))
+
+@lru_cache(maxsize=4096)
+def _cached_keyword_hits(text: str, keywords: Tuple[str, ...], pattern) -> Tuple[str, ...]:
+    """Memoized body of _match_keywords; a tuple so callers can't mutate the cached result"""
+    if not pattern.search(text):
+        return ()
+    automaton = _keyword_automaton(keywords)
+    if automaton is None:
+        return tuple(keyword for keyword in keywords if keyword in text)
+    hits = {keyword for _, keyword in automaton.iter(text)}
+    return tuple(keyword for keyword in keywords if keyword in hits)
+
+def _contract_dedup_key(contract: Dict[str, Any]):
+    """
+    Identify a listing across keyword searches: its content-derived id, else title,
+    agency and row text, else its URL
+    
+    The URL comes last because rows without a detail link often share a generic one.
+    """
+    if contract.get('id'):
+        return contract['id']
+    if contract.get('title') or contract.get('full_text'):
+        return (contract.get('title'), contract.get('agency'), contract.get('full_text'))
+    return contract.get('url')
+
+def _parse_row_fragment(html: str):
+    """Parse one result row's outer HTML into its BeautifulSoup element, with lxml where it keeps the row"""
+    body = BeautifulSoup(html, 'lxml').body
+    element = body.find() if body is not None else None
+    if element is None:
+        # Elements lxml would move out of <body> (or drop) go through the Python parser
+        element = BeautifulSoup(html, 'html.parser').find()
+    return element
+
+def _iter_pattern_matches(patterns, text: str):
+    """
+    Yield what each pattern's findall(text) would return, pattern by pattern, lazily
+    
+    Lets callers that only need the first (or first few) results stop scanning there.
+    """
+    for pattern in patterns:
+        for match in pattern.finditer(text):
+            groups = match.groups(default='')
+            if not groups:
+                yield match.group(0)
+            elif len(groups) == 1:
+                yield groups[0]
+            else:
+                yield groups
+
+@lru_cache(maxsize=4096)
+def _combined_lower_text(*fields: str) -> str:
+    """
+    Join and lowercase a contract's text fields
+    
+    Cached on the field values rather than stored on the contract dict, so filtering
+    the same contracts again (or duplicates from another keyword) skips the lowering
+    without leaking a helper key into exports or Contract.raw_data.
+    """
+    return ' '.join(fields).lower()
+
+def _min_result_rows(selector: str) -> int:
+    """Matches a row selector needs before it counts: BidNet's own row selectors are
+    trusted for a single result, generic ones need several to be meaningful"""
+    return 1 if selector in BIDNET_ROW_SELECTORS else 2
+
+# A div class repeated more often than this is taken as the listing without grouping the rest of the page
+DIV_PATTERN_GROUP_THRESHOLD = 20
+
+# Words that mark a form as a search form
+SEARCH_FORM_TERMS = ('search', 'keyword', 'query', 'solicitation')
+
+# Search forms identified by their own attributes or their fields', without serializing them
+SEARCH_FORM_SELECTOR = ', '.join(
+    f'form[{attr}*="{term}" i], form:has(:is(input, textarea, select)[{attr}*="{term}" i])'
+    for term in SEARCH_FORM_TERMS
+    for attr in ('action', 'id', 'name', 'class')
+) + ', ' + ', '.join(
+    f'form:has(:is(input, textarea)[placeholder*="{term}" i])' for term in SEARCH_FORM_TERMS
+)
+
+# Row elements that may hold the contract title, highest priority first
+TITLE_SELECTORS = (
+    'h1', 'h2', 'h3', 'h4', 'h5',
+    'strong', 'b',
+    '.title', '.name', '.description', '.project-title',
+    'a[href*="solicitation"]', 'a[href*="opportunity"]', 'a[href*="bid"]',
+    'td:first-child', 'td:nth-child(1)',  # First column in table
+    '[class*="title"]', '[class*="name"]', '[id*="title"]'
+)
+
+# Search field candidates, BidNet's own first
+SEARCH_INPUT_SELECTORS = (
+    'textarea#solicitationSingleBoxSearch',  # BidNet specific main search
+    'textarea[name="keywords"]',              # BidNet specific
+    'input[name*="search"]',
+    'input[name*="keyword"]',
+    'input[name*="query"]',
+    'textarea[placeholder*="search"]',
+    'textarea[placeholder*="keyword"]',
+    'input[placeholder*="search"]',
+    'input[placeholder*="keyword"]',
+    '#search',
+    '#searchText',
+    '#keyword',
+    '.search-input',
+    'input[type="search"]'
+)
+
+# Search button candidates, BidNet's own first
+SEARCH_BUTTON_SELECTORS = (
+    'button#topSearchButton',                 # BidNet specific
+    'button.topSearch',                       # BidNet specific
+    'button[type="submit"]',
+    'input[type="submit"]',
+    'button:has-text("Search")',
+    '.search-button',
+    '#searchButton',
+    '[data-testid*="search"]'
+)
+
+# Next-page link candidates that don't depend on the current page number
+NEXT_PAGE_SELECTORS = (
+    'a[rel="next"]',                                 # Most common "next" attribute
+    'a[class*="next"]',                             # Class contains "next"
+    'a[title*="Next"]',                             # Title contains "Next"
+    'a[aria-label*="Next"]',                        # Aria label contains "Next"
+)
+NEXT_PAGE_FALLBACK_SELECTORS = (
+    '.mets-pagination-page-icon.next',             # BidNet specific pagination
+    'a.next',                                       # Simple next class
+    'button[title*="Next"]',
+    ':text("Next")',                                # Any element reading "Next"
+    '[data-testid="next"]',
+)
+
+# Next-page controls findable in served HTML (no Playwright-only pseudo-classes)
+HTTP_NEXT_PAGE_SELECTOR = ', '.join(
+    NEXT_PAGE_SELECTORS + ('.mets-pagination-page-icon.next', 'a.next', '[data-testid="next"]')
+)
+
+# Safety limit on result pages followed per keyword, in the browser and over HTTP
+MAX_RESULT_PAGES = 20
+
+# BidNet-specific result row selectors based on page inspector analysis
+RESULT_ROW_SELECTORS = (
+    # Primary: All table rows (both odd and even)
+    *BIDNET_ROW_SELECTORS,
+    
+    # Secondary: General table patterns
+    'tbody tr',
+    'table tr:has(td)',
+    'tr[data-solicitation-id]',
+    'tr[data-id]',
+    
+    # Tertiary: Div-based layouts
+    'div[class*="solicitation"]',
+    'div[class*="opportunity"]',
+    'div[data-solicitation-id]',
+    'div:has(a[href*="solicitation"])',
+    'div:has(a[href*="opportunity"])',
+    
+    # Fallback patterns
+    '.search-result',
+    '.result-item',
+    '[class*="bid"]'
+)
+
+# Row elements scanned for a title when no title selector yields one
+TEXT_BLOCK_TAGS = frozenset(('td', 'div', 'span', 'p'))
+
+# Row elements that may hold each contract field, highest priority first
+AGENCY_SELECTORS = (
+    '.agency', '.organization', '.client', '.issuer', '.owner',
+    '[class*="agency"]', '[class*="organization"]', '[class*="client"]',
+    'td:nth-child(2)', 'td:nth-child(3)',  # Common table columns
+    '.entity-name', '.government-entity'
+)
+LOCATION_SELECTORS = (
+    '.location', '.address', '.city', '.state', '.region',
+    '[class*="location"]', '[class*="address"]', '[class*="city"]',
+    '[data-location]', '[data-address]'
+)
+DATE_SELECTORS = (
+    '.date', '.deadline', '.due-date', '.close-date', '.open-date',
+    '[class*="date"]', '[class*="deadline"]', '[class*="due"]'
+)
+
+# Present once BidNet's search form or a login form has rendered
+PAGE_READY_SELECTOR = 'textarea#solicitationSingleBoxSearch, textarea[name="keywords"], input[type="password"]'
+
+# Present once a search results page has rendered, with or without matches
+RESULTS_READY_SELECTOR = 'tr.mets-table-row, .no-results, :text("No results match your criteria")'
+
+# Text patterns used by _extract_contract_info, compiled once
+AGENCY_PATTERNS = [
+    re.compile(r'(?i)(city of|county of|state of|university of|school district|[\w\s]+ county|[\w\s]+ city)[\w\s]+'),
+    re.compile(r'(?i)(department of|ministry of|office of)[\w\s]+'),
+]
+CA_LOCATION_PATTERNS = [
+    re.compile(r'(?i)([\w\s]+),\s*(ca|california)'),
+    re.compile(r'(?i)(los angeles|orange county|san diego|san bernardino|riverside|ventura|imperial)[\w\s]*county'),
+]
+DATE_PATTERNS = [
+    re.compile(r'\d{1,2}/\d{1,2}/\d{4}'),
+    re.compile(r'\d{1,2}-\d{1,2}-\d{4}'),
+    re.compile(r'(?i)(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{1,2},?\s+\d{4}'),
+    re.compile(r'(?i)due\s*:?\s*[\d/\-\w\s,]+'),
+    re.compile(r'(?i)close\s*:?\s*[\d/\-\w\s,]+'),
+]
+AMOUNT_PATTERNS = [
+    re.compile(r'\$[\d,]+(?:\.\d{2})?'),
+    re.compile(r'(?i)value[:\s]*\$?[\d,]+'),
+    re.compile(r'(?i)amount[:\s]*\$?[\d,]+'),
+    re.compile(r'(?i)budget[:\s]*\$?[\d,]+'),
+]
+
+# Hrefs that point at a listing rather than at navigation
+LISTING_LINK_PATTERN = re.compile(r'(?i)solicitation|opportunity|bid|rfp|rfq')
+
+class RateLimiter:
+    """
+    Token bucket pacing work to `rate` starts per second
+    
+    acquire() only sleeps for whatever is left of the interval since the last start,
+    so slow work that already took longer than the interval is never delayed.
+    The bucket lives in shared memory, so one limiter handed to worker processes
+    (as a Pool initializer argument) paces all of them together.
+    """
+    
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        # [tokens, last update on the system-wide monotonic clock], guarded by its own lock
+        self._state = multiprocessing.Array('d', [float(capacity), time.monotonic()])
+    
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        with self._state.get_lock():
+            tokens, updated = self._state[0], self._state[1]
+            now = time.monotonic()
+            tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+            wait = (1 - tokens) / self.rate if tokens < 1 else 0.0
+            # Take the token now (possibly going negative) so concurrent callers queue up behind it
+            self._state[0], self._state[1] = tokens - 1, now
+        if wait > 0:
+            time.sleep(wait)
+
 class BidNetSearcher:
     def __init__(self):
         self.authenticator = BidNetAuthenticator()
@@ -21,11 +436,33 @@ class BidNetSearcher:
         self.browser = None
         self.context = None
         self.playwright = None
+        self._browser_logged_in = False  # Set once the browser session has reached the search page
+        self._debug_writer = None  # Single background thread for debug HTML dumps
+        self._search_rate_limiter = RateLimiter(rate=1.0)  # At most one search request started per second
+        self._persist_login = True  # Worker processes reuse the saved browser session but never write it
+        self._base_url = Config.BASE_URL.rstrip('/') + '/'  # Relative result links resolve against this
         self.logger = logging.getLogger(__name__)
+        self.last_result_selector = None  # Selector that matched rows in the last parsed page
+        self.last_search_complete = True  # False when an HTTP search saw a next page it couldn't fetch
+        
+        # BidNet row selector that matched on an earlier page of this searcher; tried before the rest
+        self._known_selector = None
+        
+        # Keyword lists normalized once per process instead of on every filter_hvac_contracts call
+        self.target_keywords, self._target_pattern = _normalize_keywords(
+            tuple(Config.SEARCH_PARAMS["target_keywords"]))
+        self.negative_keywords, self._negative_pattern = _normalize_keywords(
+            tuple(Config.SEARCH_PARAMS["negative_keywords"]))
         
+    def _remember_selector(self, selector: str):
+        """Remember a BidNet row selector that matched; generic fallbacks are never promoted"""
+        if selector in BIDNET_ROW_SELECTORS:
+            self._known_selector = selector
+    
     def get_authenticated_session(self):
         """Get authenticated session"""
         if not self.session:
+            # The authenticator's session is already pooled and keep-alive
             self.session = self.authenticator.get_authenticated_session()
         return self.session
     
@@ -46,19 +483,70 @@ class BidNetSearcher:
             ]
         )
         
-        # Create context with user agent and viewport
+        # Create context with user agent and viewport, restoring the last login if still fresh
+        storage_state = self._fresh_storage_state()
+        if storage_state:
+            self.logger.info(f"Reusing saved browser session from {storage_state}")
         self.context = self.browser.new_context(
             user_agent=Config.BROWSER_SETTINGS.get("user_agent", "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"),
-            viewport={'width': 1920, 'height': 1080}
+            viewport={'width': 1920, 'height': 1080},
+            storage_state=storage_state
         )
         
+        # Skip images/fonts/media; row parsing and visibility checks never need them
+        blocked_types = frozenset(Config.BROWSER_SETTINGS.get("blocked_resource_types", ()))
+        if blocked_types:
+            self.context.route(
+                "**/*",
+                lambda route: route.abort() if route.request.resource_type in blocked_types else route.continue_()
+            )
+        
         # Create new page
         self.page = self.context.new_page()
         
         return self.browser, self.context, self.page
     
+    def _fresh_storage_state(self) -> Optional[str]:
+        """Path of the saved browser session if it is younger than STORAGE_STATE_MAX_AGE, else None"""
+        try:
+            age = time.time() - os.path.getmtime(Config.STORAGE_STATE_FILE)
+        except OSError:
+            return None
+        if age > Config.STORAGE_STATE_MAX_AGE:
+            self.logger.info("Saved browser session is too old, will log in again")
+            return None
+        return Config.STORAGE_STATE_FILE
+    
+    def _save_storage_state(self, context):
+        """Persist the browser's cookies and localStorage so the next run can skip the login"""
+        if not self._persist_login:
+            return
+        try:
+            Path(Config.DATA_DIR).mkdir(exist_ok=True)
+            context.storage_state(path=Config.STORAGE_STATE_FILE)
+            self.logger.info(f"Browser session saved to {Config.STORAGE_STATE_FILE}")
+        except Exception as e:
+            self.logger.warning(f"Could not save browser session: {e}")
+    
+    def _save_debug_html(self, name: str, html_content: str) -> str:
+        """
+        Write a debug page dump to DATA_DIR/<name>.html.gz on a background thread
+        
+        Returns:
+            Path of the dump (complete once the writer thread gets to it)
+        """
+        debug_file = f"{Config.DATA_DIR}/{name}.html.gz"
+        if self._debug_writer is None:
+            self._debug_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-html")
+        self._debug_writer.submit(_write_gzip_text, debug_file, html_content)
+        return debug_file
+    
     def cleanup(self):
         """Clean up Playwright resources"""
+        if self._debug_writer is not None:
+            # Let queued debug dumps finish before the process can exit
+            self._debug_writer.shutdown(wait=True)
+            self._debug_writer = None
         try:
             if self.page:
                 self.page.close()
@@ -74,6 +562,7 @@ class BidNetSearcher:
                 self.playwright = None
         except Exception as e:
             self.logger.debug(f"Error during cleanup: {e}")
+        self._browser_logged_in = False
         
     def search_with_browser(self, keyword: str, location_filters: List[str]) -> List[Dict[str, Any]]:
         """Search using browser automation (for JavaScript-heavy sites)"""
@@ -83,18 +572,20 @@ class BidNetSearcher:
             # Setup browser
             browser, context, page = self.setup_browser()
             
-            # Navigate to main page first (cookies don't work reliably with BidNet)
-            self.logger.info("Navigating to main page (will auto-login if needed)...")
-            page.goto(Config.BASE_URL)
-            page.wait_for_load_state("networkidle")
+            # Navigate to main page first (cookies don't work reliably with BidNet); a reused
+            # browser that already reached the search page can go straight there
+            if not self._browser_logged_in:
+                self.logger.info("Navigating to main page (will auto-login if needed)...")
+                # Only its cookies matter; the search page navigation below does the waiting
+                page.goto(Config.BASE_URL, wait_until="domcontentloaded")
             
             # Navigate to search page
             search_url = f"{Config.BASE_URL}private/supplier/solicitations/search"
             self.logger.info(f"Navigating to search page with browser: {search_url}")
-            page.goto(search_url)
+            page.goto(search_url, wait_until="domcontentloaded")
             
-            # Wait for page to load
-            page.wait_for_load_state("networkidle")
+            # Wait for the search form (or a login form) instead of network idle
+            self._wait_for_page_ready(page)
             
             # Check current URL and page content to detect if we're on login page
             current_url = page.url
@@ -114,8 +605,8 @@ class BidNetSearcher:
                 
                 # After successful login, navigate back to search page
                 self.logger.info("✅ Auto-login successful, navigating to search page...")
-                page.goto(search_url)
-                page.wait_for_load_state("networkidle")
+                page.goto(search_url, wait_until="domcontentloaded")
+                self._wait_for_page_ready(page)
                 
                 # Verify we're now on the search page
                 if self.authenticator.is_login_page(page):
@@ -123,35 +614,13 @@ class BidNetSearcher:
                     return contracts
                     
                 self.logger.info("✅ Successfully reached search page after login")
+                self._save_storage_state(context)
             else:
                 self.logger.info("✅ Already on search page, no login needed")
+            self._browser_logged_in = True
             
             # Look for search input fields
-            search_element = None
-            search_selectors = [
-                'textarea#solicitationSingleBoxSearch',  # BidNet specific main search
-                'textarea[name="keywords"]',              # BidNet specific
-                'input[name*="search"]',
-                'input[name*="keyword"]',
-                'input[name*="query"]',
-                'textarea[placeholder*="search"]',
-                'textarea[placeholder*="keyword"]',
-                'input[placeholder*="search"]',
-                'input[placeholder*="keyword"]',
-                '#search',
-                '#searchText',
-                '#keyword',
-                '.search-input',
-                'input[type="search"]'
-            ]
-            
-            for selector in search_selectors:
-                try:
-                    if page.locator(selector).first.is_visible(timeout=5000):
-                        search_element = page.locator(selector).first
-                        break
-                except:
-                    continue
+            search_element = self._find_first_visible(page, SEARCH_INPUT_SELECTORS, timeout=5000)
                     
             if search_element:
                 self.logger.info(f"Found search field, entering keyword: {keyword}")
@@ -162,32 +631,14 @@ class BidNetSearcher:
                 except Exception as e:
                     self.logger.error(f"Failed to enter search term: {str(e)}")
                     # Try JavaScript input as fallback
-                    page.evaluate(f"document.querySelector('{search_selectors[0]}').value = '{keyword}'")
+                    page.evaluate(f"document.querySelector('{SEARCH_INPUT_SELECTORS[0]}').value = '{keyword}'")
                 
                 # For now, skip complex filter handling and just do basic search
                 # (California filtering can be added back later once basic search works)
                 self.logger.info("Skipping location filters for initial test - will search all locations")
                 
                 # Look for search button
-                search_button_element = None
-                button_selectors = [
-                    'button#topSearchButton',                 # BidNet specific
-                    'button.topSearch',                       # BidNet specific  
-                    'button[type="submit"]',
-                    'input[type="submit"]',
-                    'button:has-text("Search")',
-                    '.search-button',
-                    '#searchButton',
-                    '[data-testid*="search"]'
-                ]
-                
-                for selector in button_selectors:
-                    try:
-                        if page.locator(selector).first.is_visible(timeout=2000):
-                            search_button_element = page.locator(selector).first
-                            break
-                    except:
-                        continue
+                search_button_element = self._find_first_visible(page, SEARCH_BUTTON_SELECTORS, timeout=2000)
                 
                 if search_button_element:
                     self.logger.info("Clicking search button...")
@@ -197,8 +648,8 @@ class BidNetSearcher:
                     if search_element:
                         search_element.press("Enter")
                 
-                # Wait for results to load 
-                page.wait_for_load_state("networkidle")
+                # Wait for the result rows themselves rather than for the network to go idle
+                self._wait_for_results(page)
                 
                 # Get all results across all pages
                 contracts = self._get_all_paginated_results(page, keyword)
@@ -206,22 +657,86 @@ class BidNetSearcher:
             else:
                 self.logger.warning("Could not find search field on page")
                 # Save the page for debugging
-                page_html = page.content()
-                debug_file = f"{Config.DATA_DIR}/debug_search_page_browser.html"
-                with open(debug_file, 'w', encoding='utf-8') as f:
-                    f.write(page_html)
+                debug_file = self._save_debug_html("debug_search_page_browser", page.content())
                 self.logger.info(f"Saved search page HTML: {debug_file}")
                 
         except Exception as e:
             self.logger.error(f"Browser search failed for '{keyword}': {str(e)}")
         
-        finally:
-            self.cleanup()
-                
+        # The browser stays open for the next keyword; callers release it with cleanup()
         return contracts
     
+    def _wait_for_page_ready(self, page, timeout: int = 15000):
+        """
+        Wait until the search form or a login form is on the page
+        
+        Analytics and long-polling can keep "networkidle" from ever settling, so that is
+        only the fallback for pages showing neither form (e.g. a redirect in progress).
+        """
+        try:
+            page.wait_for_selector(PAGE_READY_SELECTOR, timeout=timeout)
+        except Exception as e:
+            self.logger.debug(f"Neither search nor login form within {timeout}ms, waiting for network idle: {e}")
+            try:
+                page.wait_for_load_state("networkidle", timeout=timeout)
+            except Exception as e:
+                self.logger.debug(f"Network did not go idle: {e}")
+    
+    def _wait_for_results(self, page, previous_row=None, timeout: int = 10000,
+                          stale_row_timeout: int = 2000):
+        """
+        Wait until a results page (or the no-results message) is rendered
+        
+        Args:
+            page: Playwright page
+            previous_row: Element handle for a row of the page being left; when given,
+                waits briefly for it to go away first so the old rows aren't parsed again
+            timeout: Maximum wait in milliseconds for the results
+            stale_row_timeout: Maximum wait in milliseconds for the old row; rows updated
+                in place never go away, so this stays short
+        """
+        if previous_row:
+            try:
+                previous_row.wait_for_element_state("hidden", timeout=stale_row_timeout)
+            except Exception as e:
+                # Already detached, or reused in place for the new page
+                self.logger.debug(f"Previous results row still present after {stale_row_timeout}ms: {e}")
+        
+        try:
+            page.wait_for_selector(RESULTS_READY_SELECTOR, timeout=timeout)
+        except Exception as e:
+            self.logger.debug(f"Results did not appear within {timeout}ms: {e}")
+    
+    def _find_first_visible(self, page, selectors: Sequence[str], timeout: int):
+        """
+        Find the highest-priority visible element among selectors
+        
+        Waits once for any selector to match a visible element, then returns the
+        first selector (in list order) with a visible match, or None on timeout.
+        """
+        combined = page.locator(', '.join(selectors)).filter(visible=True)
+        try:
+            combined.first.wait_for(state="visible", timeout=timeout)
+        except Exception:
+            return None
+        
+        # Check every selector in one round-trip; only Playwright-specific selectors the
+        # browser's querySelectorAll can't parse (e.g. :has-text) need their own query
+        states = page.evaluate(VISIBLE_SELECTOR_STATES_JS, selectors)
+        for selector, state in zip(selectors, states):
+            if state == "visible":
+                return page.locator(selector).filter(visible=True).first
+            if state == "unsupported":
+                try:
+                    candidate = page.locator(selector).filter(visible=True)
+                    if candidate.count():
+                        return candidate.first
+                except Exception as e:
+                    self.logger.debug(f"Selector '{selector}' failed: {e}")
+        return combined.first
+    
     def search_contracts(self, keywords: List[str] = None, location_filters: List[str] = None, 
-                        max_results: int = 100) -> List[Dict[str, Any]]:
+                        max_results: int = 100, max_workers: int = None) -> List[Dict[str, Any]]:
         """
         Search for contracts on BidNet Direct
         
@@ -229,6 +744,8 @@ class BidNetSearcher:
             keywords: List of search keywords
             location_filters: List of location filters
             max_results: Maximum number of results to return
+            max_workers: Browser processes to search keywords with (default 1: sequentially
+                in this process). Workers share this searcher's rate limit and its saved login.
             
         Returns:
             List of contract dictionaries
@@ -245,55 +762,107 @@ class BidNetSearcher:
             location_filters = Config.SEARCH_PARAMS["location_filters"]
             
         all_contracts = []
+        seen_ids = set()
         
         # Search with each keyword combination (use browser-based search for JavaScript sites)
         search_limit = min(len(keywords), 3)  # Limit to 3 for browser testing
-        for keyword in tqdm(keywords[:search_limit], desc="Searching keywords"):
-            self.logger.info(f"Searching for: {keyword}")
-            
-            # Use browser-based search instead of requests
-            contracts = self.search_with_browser(keyword, location_filters)
-            
-            # Add unique contracts
-            for contract in contracts:
-                if not any(c.get('id') == contract.get('id') for c in all_contracts):
-                    all_contracts.append(contract)
-                    
-            # Respect rate limits
-            time.sleep(1)
-            
-            if len(all_contracts) >= max_results:
-                break
+        search_keywords = keywords[:search_limit]
+        if max_workers is None:
+            max_workers = 1
+        
+        keyword_results = self._iter_keyword_results(session, search_keywords, location_filters, max_workers)
+        with closing(keyword_results):
+            for contracts in tqdm(keyword_results, total=len(search_keywords), desc="Searching keywords"):
+                # Add unique contracts (the same listing often comes back under several keywords)
+                for contract in contracts:
+                    contract_key = _contract_dedup_key(contract)
+                    if contract_key not in seen_ids:
+                        seen_ids.add(contract_key)
+                        all_contracts.append(contract)
+                
+                if len(all_contracts) >= max_results:
+                    break
                 
         self.logger.info(f"Found {len(all_contracts)} total contracts")
         return all_contracts[:max_results]
     
+    def _iter_keyword_results(self, session: requests.Session, keywords: List[str],
+                              location_filters: List[str], max_workers: int):
+        """Yield each keyword's contracts in keyword order, using the browser only when needed"""
+        # Plain HTTP search first; only keywords whose results weren't in the served HTML
+        # (i.e. rendered client-side) go to a browser
+        http_results = {}
+        for keyword in keywords:
+            contracts = self._search_single_keyword(session, keyword, location_filters)
+            if contracts and self.last_result_selector in BIDNET_ROW_SELECTORS and self.last_search_complete:
+                self.logger.info(f"Found {len(contracts)} contracts for '{keyword}' without a browser")
+                http_results[keyword] = contracts
+        
+        browser_keywords = [keyword for keyword in keywords if keyword not in http_results]
+        browser_results = self._iter_browser_results(browser_keywords, location_filters, max_workers)
+        with closing(browser_results):
+            for keyword in keywords:
+                if keyword in http_results:
+                    yield http_results[keyword]
+                else:
+                    yield next(browser_results)
+    
+    def _iter_browser_results(self, keywords: List[str], location_filters: List[str], max_workers: int):
+        """Yield each keyword's browser search contracts in keyword order"""
+        # The first keyword always runs here, so a parallel search logs in once and saves
+        # the session every worker then starts from
+        max_workers = min(max_workers, len(keywords) - 1)
+        if max_workers > 1:
+            first_keyword, other_keywords = keywords[0], keywords[1:]
+            try:
+                self._search_rate_limiter.acquire()
+                self.logger.info(f"Searching for: {first_keyword}")
+                yield self.search_with_browser(first_keyword, location_filters)
+            finally:
+                self.cleanup()
+            
+            # Playwright's sync API isn't thread-safe, so each worker process drives its own browser
+            self.logger.info(f"Searching {len(other_keywords)} keywords with {max_workers} browser processes")
+            worker = partial(_search_keyword_worker, location_filters=location_filters)
+            with multiprocessing.Pool(processes=max_workers, initializer=_init_search_worker,
+                                      initargs=(self._search_rate_limiter,)) as pool:
+                yield from pool.imap(worker, other_keywords)
+            return
+        
+        try:
+            # One browser session is shared by all keyword searches
+            for keyword in keywords:
+                self._search_rate_limiter.acquire()  # Respect rate limits
+                
+                self.logger.info(f"Searching for: {keyword}")
+                yield self.search_with_browser(keyword, location_filters)
+        finally:
+            self.cleanup()
+    
     def _get_all_paginated_results(self, page, keyword: str) -> List[Dict[str, Any]]:
         """Get results from all pages of search results"""
         all_contracts = []
         page_num = 1
-        max_pages = 20  # Safety limit
-        
-        while page_num <= max_pages:
+        while page_num <= MAX_RESULT_PAGES:
             self.logger.info(f"Processing page {page_num} of results...")
             
             # Save current page source for debugging
-            debug_file = f"{Config.DATA_DIR}/debug_browser_results_page_{page_num}.html"
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(page.content())
-            self.logger.info(f"Saved page {page_num} HTML: {debug_file}")
-            
-            # Parse results from current page
-            page_contracts = self._parse_search_results(page.content(), keyword)
+            if Config.DEBUG_DUMP_HTML:
+                debug_file = self._save_debug_html(f"debug_browser_results_page_{page_num}", page.content())
+                self.logger.info(f"Saved page {page_num} HTML: {debug_file}")
             
-            # Debug: Check how many total rows exist vs how many we extracted
+            # Pull just the result rows out of the live DOM; full-page parse only if none match
             try:
-                all_rows = page.locator('tr[class*="mets-table-row"]').all()
-                all_odd_rows = page.locator('tr.mets-table-row.odd').all()
-                all_even_rows = page.locator('tr.mets-table-row.even').all()
-                self.logger.info(f"📊 Page {page_num} debug - Total rows: {len(all_rows)}, Odd: {len(all_odd_rows)}, Even: {len(all_even_rows)}, Extracted: {len(page_contracts)}")
+                result_rows = page.evaluate(RESULT_ROWS_JS, [list(BIDNET_ROW_SELECTORS), 50])
             except Exception as e:
-                self.logger.debug(f"Could not count page rows: {e}")
+                self.logger.debug(f"Could not read result rows from page: {e}")
+                result_rows = None
+            
+            if result_rows:
+                page_contracts = self._contracts_from_row_html(result_rows['rows'], result_rows['selector'], keyword)
+                self.logger.info(f"📊 Page {page_num} debug - Total rows: {result_rows['total']}, Odd: {result_rows['odd']}, Even: {result_rows['even']}, Extracted: {len(page_contracts)}")
+            else:
+                page_contracts = self._parse_search_results(page.content(), keyword)
             
             if not page_contracts:
                 empty_pages = getattr(self, '_empty_page_count', 0) + 1
@@ -312,48 +881,28 @@ class BidNetSearcher:
             self.logger.info(f"Found {len(page_contracts)} contracts on page {page_num} (total: {len(all_contracts)})")
             
             # Look for next page button with more comprehensive selectors
-            next_button = None
             next_selectors = [
-                'a[rel="next"]',                                 # Most common "next" attribute
-                'a[class*="next"]',                             # Class contains "next"
-                'a[title*="Next"]',                             # Title contains "Next"
-                'a[aria-label*="Next"]',                        # Aria label contains "Next"
-                f'a[href*="pageNumber={page_num + 1}"]',       # Direct page number link (fixed variable name)
-                '.mets-pagination-page-icon.next',             # BidNet specific pagination
-                'a.next',                                       # Simple next class
-                'button[title*="Next"]',
-                '.pagination a:contains("Next")',
-                '[data-testid="next"]',
+                *NEXT_PAGE_SELECTORS,
+                f'a[href*="pageNumber={page_num + 1}"]',       # Direct page number link
+                *NEXT_PAGE_FALLBACK_SELECTORS,
                 f'a[href*="&pageNumber={page_num + 1}"]',      # Alternative page number format
                 f'a:has-text("{page_num + 1}")'                # Link containing next page number
             ]
             
-            for selector in next_selectors:
-                try:
-                    if 'contains' in selector:
-                        # Use text-based selector for Playwright
-                        next_button = page.locator("text=Next").first
-                    else:
-                        next_button = page.locator(selector).first
-                    
-                    if next_button.is_visible(timeout=2000):
-                        self.logger.info(f"Found next page button: {selector}")
-                        break
-                    else:
-                        next_button = None
-                except Exception as e:
-                    self.logger.debug(f"Next button selector '{selector}' failed: {e}")
-                    continue
+            # One bounded wait for any candidate instead of a timeout per selector
+            next_button = self._find_first_visible(page, next_selectors, timeout=2000)
+            if next_button:
+                self.logger.info("Found next page button")
             
             if next_button:
                 try:
                     # Scroll to button and click
                     next_button.scroll_into_view_if_needed()
-                    time.sleep(1)
+                    previous_row = page.query_selector(RESULTS_READY_SELECTOR)
                     
                     # Try clicking the button
                     next_button.click()
-                    time.sleep(3)  # Wait for page to load
+                    self._wait_for_results(page, previous_row)
                     page_num += 1
                 except Exception as e:
                     self.logger.error(f"Failed to click next page button: {e}")
@@ -365,9 +914,9 @@ class BidNetSearcher:
                     if next_page_link.is_visible(timeout=2000):
                         self.logger.info(f"Found direct page {page_num + 1} link")
                         next_page_link.scroll_into_view_if_needed()
-                        time.sleep(1)
+                        previous_row = page.query_selector(RESULTS_READY_SELECTOR)
                         next_page_link.click()
-                        time.sleep(3)
+                        self._wait_for_results(page, previous_row)
                         page_num += 1
                         continue
                 except Exception as e:
@@ -394,6 +943,7 @@ class BidNetSearcher:
             List of contract dictionaries
         """
         contracts = []
+        self.last_search_complete = True
         
         try:
             # First, let's navigate to the main search page to understand the structure
@@ -401,6 +951,7 @@ class BidNetSearcher:
             self.logger.info(f"Accessing main search page: {main_search_url}")
             
             # Get the search page first
+            self._search_rate_limiter.acquire()
             initial_response = session.get(main_search_url)
             
             if initial_response.status_code != 200:
@@ -409,17 +960,18 @@ class BidNetSearcher:
                 return contracts
             
             # Parse the search page to understand the form structure
-            soup = BeautifulSoup(initial_response.content, 'html.parser')
+            soup = BeautifulSoup(initial_response.content, 'lxml')
             
             # Look for search form
-            search_forms = soup.find_all('form')
-            search_form = None
-            
-            for form in search_forms:
-                # Look for forms that might be search forms
-                if any(field in str(form).lower() for field in ['search', 'keyword', 'query', 'solicitation']):
-                    search_form = form
-                    break
+            search_form = soup.select_one(SEARCH_FORM_SELECTOR)
+            
+            if search_form is None:
+                # Slow path: forms that only mention a search term in their text
+                for form in soup.find_all('form'):
+                    # Look for forms that might be search forms
+                    if any(field in str(form).lower() for field in SEARCH_FORM_TERMS):
+                        search_form = form
+                        break
             
             if search_form:
                 self.logger.info("Found search form, analyzing structure...")
@@ -461,6 +1013,7 @@ class BidNetSearcher:
                     })
                 
                 # Make search request
+                self._search_rate_limiter.acquire()
                 if search_form.get('method', '').lower() == 'post':
                     response = session.post(form_action, data=search_params)
                 else:
@@ -490,6 +1043,7 @@ class BidNetSearcher:
                     params['category'] = 'Construction'
                     
                     try:
+                        self._search_rate_limiter.acquire()
                         test_response = session.get(main_search_url, params=params)
                         if test_response.status_code == 200 and 'saml' not in test_response.url.lower():
                             response = test_response
@@ -499,6 +1053,7 @@ class BidNetSearcher:
                         continue
                 
                 if not response:
+                    self._search_rate_limiter.acquire()
                     response = session.get(main_search_url)
             
             if response.status_code != 200:
@@ -508,11 +1063,75 @@ class BidNetSearcher:
             # Parse response
             contracts = self._parse_search_results(response.text, keyword)
             
+            # BidNet serves its rows in the HTML, so the remaining pages can be fetched the same way
+            if contracts and self.last_result_selector in BIDNET_ROW_SELECTORS:
+                contracts.extend(self._fetch_remaining_result_pages(session, response, keyword))
+            
         except Exception as e:
             self.logger.error(f"Error searching for '{keyword}': {str(e)}")
             
         return contracts
     
+    def _fetch_remaining_result_pages(self, session: requests.Session, response: requests.Response,
+                                      keyword: str) -> List[Dict[str, Any]]:
+        """
+        Follow a served results page's next-page links, up to MAX_RESULT_PAGES in total
+        
+        Sets last_search_complete to False when a next page exists that can't be fetched
+        over HTTP (e.g. a script-driven link), so the caller can use the browser instead.
+        
+        Returns:
+            Contracts from the pages after the first
+        """
+        first_selector = self.last_result_selector
+        contracts = []
+        seen_urls = {response.url}
+        
+        for page_num in range(1, MAX_RESULT_PAGES):
+            has_next, next_url = self._next_results_page_url(response.text, response.url, page_num)
+            if not has_next:
+                break
+            if next_url is None or next_url in seen_urls:
+                self.logger.info(f"Page {page_num} has a next page that can't be followed over HTTP")
+                self.last_search_complete = False
+                break
+            seen_urls.add(next_url)
+            
+            self._search_rate_limiter.acquire()
+            response = session.get(next_url)
+            if response.status_code != 200:
+                self.logger.warning(f"Results page {page_num + 1} failed with status {response.status_code}")
+                self.last_search_complete = False
+                break
+            
+            page_contracts = self._parse_search_results(response.text, keyword)
+            if not page_contracts or self.last_result_selector not in BIDNET_ROW_SELECTORS:
+                break
+            contracts.extend(page_contracts)
+            self.logger.info(f"Found {len(page_contracts)} contracts on page {page_num + 1} (total: {len(contracts)})")
+        
+        self.last_result_selector = first_selector
+        return contracts
+    
+    def _next_results_page_url(self, html_content: str, current_url: str, page_num: int):
+        """
+        Find a served results page's link to the following page
+        
+        Returns:
+            Tuple of (whether a next-page control exists, its absolute URL or None if it
+            has no fetchable href)
+        """
+        soup = BeautifulSoup(html_content, 'lxml')
+        control = soup.select_one(f'{HTTP_NEXT_PAGE_SELECTOR}, a[href*="pageNumber={page_num + 1}"]')
+        if control is None:
+            return False, None
+        
+        link = control if control.name == 'a' else (control.find_parent('a') or control)
+        href = (link.get('href') or '').strip()
+        if not href or href.startswith(('#', 'javascript:')):
+            return True, None
+        return True, urljoin(current_url, href)
+    
     def _parse_search_results(self, html_content: str, search_keyword: str) -> List[Dict[str, Any]]:
         """
         Parse search results from HTML content
@@ -527,56 +1146,40 @@ class BidNetSearcher:
         contracts = []
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
             # Save full HTML for debugging (first time only)
-            if not hasattr(self, '_html_saved'):
-                debug_file = f"{Config.DATA_DIR}/debug_search_page.html"
-                with open(debug_file, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
+            if Config.DEBUG_DUMP_HTML and not hasattr(self, '_html_saved'):
+                debug_file = self._save_debug_html("debug_search_page", html_content)
                 self.logger.info(f"Saved full HTML for debugging: {debug_file}")
                 self._html_saved = True
             
-            # BidNet-specific selectors based on page inspector analysis
-            contract_selectors = [
-                # Primary: All table rows (both odd and even)
-                'tr[class*="mets-table-row"]',               # Gets BOTH odd and even rows
-                'tr.mets-table-row',                         # Any mets-table-row
-                'tr.mets-table-row.odd, tr.mets-table-row.even',  # Explicit odd + even
-                
-                # Secondary: General table patterns
-                'tbody tr',
-                'table tr:has(td)',
-                'tr[data-solicitation-id]',
-                'tr[data-id]',
-                
-                # Tertiary: Div-based layouts  
-                'div[class*="solicitation"]',
-                'div[class*="opportunity"]',
-                'div[data-solicitation-id]',
-                'div:has(a[href*="solicitation"])',
-                'div:has(a[href*="opportunity"])',
-                
-                # Fallback patterns
-                '.search-result',
-                '.result-item',
-                '[class*="bid"]'
-            ]
+            contract_selectors = list(RESULT_ROW_SELECTORS)
+            
+            # Try the selector that matched last time first so later pages skip the probing
+            if self._known_selector in contract_selectors:
+                contract_selectors.remove(self._known_selector)
+                contract_selectors.insert(0, self._known_selector)
             
             contract_elements = []
             used_selector = None
             
-            for selector in contract_selectors:
-                try:
-                    elements = soup.select(selector)
-                    if elements and len(elements) > 1:  # Need multiple results to be meaningful
-                        contract_elements = elements
-                        used_selector = selector
-                        self.logger.info(f"Found {len(elements)} contracts using selector: {selector}")
-                        break
-                except Exception as e:
-                    self.logger.debug(f"Selector '{selector}' failed: {e}")
-                    continue
+            if SELECTOLAX_AVAILABLE:
+                contract_elements, used_selector = self._select_result_rows_fast(html_content, contract_selectors)
+            
+            # Full BeautifulSoup pass only when the fast path is unavailable or found nothing
+            if not contract_elements:
+                soup = BeautifulSoup(html_content, 'lxml')
+                
+                for selector in contract_selectors:
+                    try:
+                        elements = soup.select(selector)
+                        if len(elements) >= _min_result_rows(selector):
+                            contract_elements = elements
+                            used_selector = selector
+                            self.logger.info(f"Found {len(elements)} contracts using selector: {selector}")
+                            break
+                    except Exception as e:
+                        self.logger.debug(f"Selector '{selector}' failed: {e}")
+                        continue
                     
             if not contract_elements:
                 # More aggressive fallback: look for any structure with multiple similar elements
@@ -592,26 +1195,16 @@ class BidNetSearcher:
                         self.logger.info(f"Found table with {len(contract_elements)} rows")
                         break
                 
-                # If still nothing, look for repeated div patterns
-                if not contract_elements:
-                    all_divs = soup.find_all('div')
-                    # Group divs by class patterns
-                    class_groups = {}
-                    for div in all_divs:
-                        classes = div.get('class', [])
-                        if classes:
-                            class_key = ' '.join(sorted(classes))
-                            if class_key not in class_groups:
-                                class_groups[class_key] = []
-                            class_groups[class_key].append(div)
-                    
-                    # Find the largest group (likely the contract listing)
-                    largest_group = max(class_groups.values(), key=len, default=[])
-                    if len(largest_group) > 2:
-                        contract_elements = largest_group
-                        used_selector = f"div pattern (fallback) - {largest_group[0].get('class', [])}"
-                        self.logger.info(f"Found repeated div pattern with {len(contract_elements)} elements")
+                # If still nothing, look for repeated div patterns (opt-in; walks every classed div)
+                if not contract_elements and Config.ALLOW_DIV_PATTERN_FALLBACK:
+                    contract_elements, used_selector = self._find_repeated_div_pattern(soup)
+                elif not contract_elements and not self._no_results_page(soup):
+                    self.logger.warning("No result rows matched any selector; the results markup may have changed "
+                                        "(set BIDNET_ALLOW_DIV_PATTERN_FALLBACK=true to guess rows from repeated divs)")
                 
+            self.last_result_selector = used_selector
+            if used_selector in contract_selectors:
+                self._remember_selector(used_selector)
             if contract_elements:
                 self.logger.info(f"Processing {len(contract_elements)} elements with selector: {used_selector}")
                 
@@ -627,6 +1220,92 @@ class BidNetSearcher:
             
         return contracts
     
+    def _no_results_page(self, soup) -> bool:
+        """Whether the page is BidNet's legitimate empty result page"""
+        return bool(soup.select_one('.no-results') or soup.find(string=NO_RESULTS_TEXT_PATTERN))
+    
+    def _find_repeated_div_pattern(self, soup):
+        """
+        Guess result rows as the first div class pattern repeated past DIV_PATTERN_GROUP_THRESHOLD
+        
+        Falls back to the largest group seen if none gets that far.
+        
+        Returns:
+            Tuple of (div elements, selector description); ([], None) if nothing repeats
+        """
+        all_divs = soup.select('div[class]')
+        class_groups = {}
+        for index, div in enumerate(all_divs):
+            class_key = ' '.join(sorted(div['class']))
+            group = class_groups.setdefault(class_key, [])
+            group.append(div)
+            if len(group) > DIV_PATTERN_GROUP_THRESHOLD:
+                # Big enough to be the listing: pick up the rest of this pattern and stop grouping
+                group.extend(d for d in all_divs[index + 1:] if ' '.join(sorted(d['class'])) == class_key)
+                break
+        
+        largest_group = max(class_groups.values(), key=len, default=[])
+        if len(largest_group) <= 2:
+            return [], None
+        self.logger.info(f"Found repeated div pattern with {len(largest_group)} elements")
+        return largest_group, f"div pattern (fallback) - {largest_group[0].get('class', [])}"
+    
+    def _contracts_from_row_html(self, rows: List[str], selector: str, search_keyword: str) -> List[Dict[str, Any]]:
+        """
+        Build contracts from result-row HTML already located in the browser
+        
+        Args:
+            rows: Outer HTML of each result row
+            selector: Row selector that matched
+            search_keyword: The keyword used for search
+            
+        Returns:
+            List of contract dictionaries
+        """
+        self.logger.info(f"Found {len(rows)} contracts using selector: {selector}")
+        self.last_result_selector = selector
+        self._remember_selector(selector)
+        
+        contracts = []
+        for i, row_html in enumerate(rows):
+            element = _parse_row_fragment(row_html)
+            if element is None:
+                continue
+            contract = self._extract_contract_info(element, search_keyword, i)
+            if contract:
+                contracts.append(contract)
+                self.logger.debug(f"Extracted: {contract.get('title', 'No title')[:100]}")
+        
+        return contracts
+    
+    def _select_result_rows_fast(self, html_content: str, selectors: List[str]):
+        """
+        Locate result rows with selectolax and parse only those rows with BeautifulSoup
+        
+        Returns:
+            Tuple of (row elements, selector used); ([], None) if no selector matched
+        """
+        try:
+            tree = LexborHTMLParser(html_content)
+        except Exception as e:
+            self.logger.debug(f"selectolax parse failed: {e}")
+            return [], None
+        
+        for selector in selectors:
+            try:
+                nodes = tree.css(selector)
+            except Exception as e:
+                self.logger.debug(f"Selector '{selector}' failed: {e}")
+                continue
+            
+            if len(nodes) >= _min_result_rows(selector):
+                self.logger.info(f"Found {len(nodes)} contracts using selector: {selector}")
+                # Only the rows that get extracted are turned into soup fragments
+                elements = [_parse_row_fragment(node.html) for node in nodes[:50]]
+                return elements, selector
+        
+        return [], None
+    
     def _extract_contract_info(self, element, search_keyword: str, index: int) -> Optional[Dict[str, Any]]:
         """
         Extract contract information from HTML element
@@ -640,46 +1319,44 @@ class BidNetSearcher:
             Dictionary with contract information or None
         """
         try:
-            element_text = element.get_text(strip=True)
+            # One walk over the row's strings yields both text forms get_text() would build
+            pieces = list(element.strings)
+            element_text = ''.join(piece.strip() for piece in pieces if piece.strip())  # get_text(strip=True)
+            raw_text = ''.join(pieces)  # Unstripped text shared by all the regex fallbacks below
             contract = {
-                'id': f"{search_keyword}_{index}_{int(time.time())}",
+                # Content-derived so the same listing keeps its id across keywords and runs
+                'id': f"bidnet_{hashlib.blake2b(element_text.encode('utf-8'), digest_size=8).hexdigest()}",
                 'search_keyword': search_keyword,
-                'raw_html': str(element)[:1000],  # Store more HTML for debugging
                 'full_text': element_text[:500]  # Store text content for analysis
             }
+            if Config.DEBUG_STORE_RAW_HTML:
+                contract['raw_html'] = str(element)[:1000]  # Store more HTML for debugging
             
             # Enhanced title extraction - try multiple approaches
             title = None
             
             # Method 1: Look for strong/bold titles or headings
-            title_selectors = [
-                'h1', 'h2', 'h3', 'h4', 'h5',
-                'strong', 'b',
-                '.title', '.name', '.description', '.project-title',
-                'a[href*="solicitation"]', 'a[href*="opportunity"]', 'a[href*="bid"]',
-                'td:first-child', 'td:nth-child(1)',  # First column in table
-                '[class*="title"]', '[class*="name"]', '[id*="title"]'
-            ]
-            
-            for selector in title_selectors:
-                try:
-                    found = element.select_one(selector)
-                    if found:
-                        text = found.get_text(strip=True)
-                        if text and len(text) > 10 and text != search_keyword:  # Avoid generic text
-                            title = text
-                            break
-                except:
-                    continue
+            # One traversal for all title selectors; priority resolved as in _extract_text_by_selectors
+            compound, patterns = _compile_field_selectors(TITLE_SELECTORS)
+            candidates = compound.select(element)
+            for pattern in patterns:
+                found = next((candidate for candidate in candidates if pattern.match(candidate)), None)
+                if found:
+                    text = found.get_text(strip=True)
+                    if text and len(text) > 10 and text != search_keyword:  # Avoid generic text
+                        title = text
+                        break
             
             # Method 2: If no good title, look for the longest meaningful text block
             if not title:
-                text_elements = element.find_all(['td', 'div', 'span', 'p'])
-                for elem in text_elements:
+                # Walk lazily so the scan stops at the first usable block
+                for elem in element.descendants:
+                    if elem.name not in TEXT_BLOCK_TAGS:
+                        continue
                     text = elem.get_text(strip=True)
                     if text and len(text) > 15 and len(text) < 200:  # Reasonable title length
                         # Skip generic text
-                        if not any(generic in text.lower() for generic in ['search', 'result', 'page', 'filter', 'sort']):
+                        if not GENERIC_TEXT_PATTERN.search(text):
                             title = text
                             break
             
@@ -702,80 +1379,35 @@ class BidNetSearcher:
             contract['title'] = title
             
             # Enhanced agency extraction
-            agency_selectors = [
-                '.agency', '.organization', '.client', '.issuer', '.owner',
-                '[class*="agency"]', '[class*="organization"]', '[class*="client"]',
-                'td:nth-child(2)', 'td:nth-child(3)',  # Common table columns
-                '.entity-name', '.government-entity'
-            ]
-            
-            agency = self._extract_text_by_selectors(element, agency_selectors)
+            agency = self._extract_text_by_selectors(element, AGENCY_SELECTORS)
             
             # Look for agency in text patterns
             if not agency:
-                text = element.get_text()
                 # Common agency patterns
-                agency_patterns = [
-                    r'(?i)(city of|county of|state of|university of|school district|[\w\s]+ county|[\w\s]+ city)[\w\s]+',
-                    r'(?i)(department of|ministry of|office of)[\w\s]+',
-                ]
-                for pattern in agency_patterns:
-                    matches = re.findall(pattern, text)
-                    if matches:
-                        agency = matches[0]
-                        break
+                agency = next(_iter_pattern_matches(AGENCY_PATTERNS, raw_text), None)
             
             contract['agency'] = agency or 'Unknown agency'
             
             # Enhanced location extraction
-            location_selectors = [
-                '.location', '.address', '.city', '.state', '.region',
-                '[class*="location"]', '[class*="address"]', '[class*="city"]',
-                '[data-location]', '[data-address]'
-            ]
-            
-            location = self._extract_text_by_selectors(element, location_selectors)
+            location = self._extract_text_by_selectors(element, LOCATION_SELECTORS)
             
             # Look for CA locations in text
             if not location:
-                text = element.get_text()
-                ca_patterns = [
-                    r'(?i)([\w\s]+),\s*(ca|california)',
-                    r'(?i)(los angeles|orange county|san diego|san bernardino|riverside|ventura|imperial)[\w\s]*county',
-                ]
-                for pattern in ca_patterns:
-                    matches = re.findall(pattern, text)
-                    if matches:
-                        location = matches[0] if isinstance(matches[0], str) else ' '.join(matches[0])
-                        break
+                match = next(_iter_pattern_matches(CA_LOCATION_PATTERNS, raw_text), None)
+                if match is not None:
+                    location = match if isinstance(match, str) else ' '.join(match)
             
             contract['location'] = location or 'Unknown location'
             
             # Enhanced date extraction
-            date_selectors = [
-                '.date', '.deadline', '.due-date', '.close-date', '.open-date',
-                '[class*="date"]', '[class*="deadline"]', '[class*="due"]'
-            ]
-            
-            dates = self._extract_text_by_selectors(element, date_selectors)
+            dates = self._extract_text_by_selectors(element, DATE_SELECTORS)
             
             # Look for date patterns in text
             if not dates:
-                text = element.get_text()
-                date_patterns = [
-                    r'\d{1,2}/\d{1,2}/\d{4}',
-                    r'\d{1,2}-\d{1,2}-\d{4}',
-                    r'(?i)(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{1,2},?\s+\d{4}',
-                    r'(?i)due\s*:?\s*[\d/\-\w\s,]+',
-                    r'(?i)close\s*:?\s*[\d/\-\w\s,]+',
-                ]
-                found_dates = []
-                for pattern in date_patterns:
-                    matches = re.findall(pattern, text)
-                    found_dates.extend(matches)
+                found_dates = list(islice(_iter_pattern_matches(DATE_PATTERNS, raw_text), 3))
                 
                 if found_dates:
-                    dates = ' | '.join(found_dates[:3])  # Take first 3 dates
+                    dates = ' | '.join(found_dates)  # Take first 3 dates
             
             contract['dates'] = dates or 'No dates found'
             
@@ -785,7 +1417,7 @@ class BidNetSearcher:
             
             for link in links:
                 href = link.get('href', '')
-                if any(keyword in href.lower() for keyword in ['solicitation', 'opportunity', 'bid', 'rfp', 'rfq']):
+                if LISTING_LINK_PATTERN.search(href):
                     best_link = href
                     break
             
@@ -793,33 +1425,13 @@ class BidNetSearcher:
                 best_link = links[0].get('href', '')
             
             if best_link:
-                if not best_link.startswith('http'):
-                    if best_link.startswith('//'):
-                        best_link = 'https:' + best_link
-                    elif best_link.startswith('/'):
-                        best_link = Config.BASE_URL.rstrip('/') + best_link
-                    else:
-                        best_link = Config.BASE_URL.rstrip('/') + '/' + best_link
-                contract['url'] = best_link
+                # Handles absolute, protocol-relative, root-relative and relative hrefs alike
+                contract['url'] = urljoin(self._base_url, best_link)
             else:
                 contract['url'] = None
                 
             # Enhanced value extraction
-            amount_patterns = [
-                r'\$[\d,]+(?:\.\d{2})?',
-                r'(?i)value[:\s]*\$?[\d,]+',
-                r'(?i)amount[:\s]*\$?[\d,]+',
-                r'(?i)budget[:\s]*\$?[\d,]+',
-            ]
-            
-            amount_text = element.get_text()
-            found_amounts = []
-            
-            for pattern in amount_patterns:
-                matches = re.findall(pattern, amount_text)
-                found_amounts.extend(matches)
-            
-            contract['estimated_value'] = found_amounts[0] if found_amounts else 'Not specified'
+            contract['estimated_value'] = next(_iter_pattern_matches(AMOUNT_PATTERNS, raw_text), 'Not specified')
             
             return contract
             
@@ -827,25 +1439,32 @@ class BidNetSearcher:
             self.logger.error(f"Error extracting contract info: {str(e)}")
             return None
     
-    def _extract_text_by_selectors(self, element, selectors: List[str]) -> Optional[str]:
+    def _extract_text_by_selectors(self, element, selectors: Sequence[str]) -> Optional[str]:
         """Extract text using multiple CSS selectors"""
-        for selector in selectors:
-            try:
-                found = element.select_one(selector)
-                if found:
-                    text = found.get_text().strip()
-                    if text:
-                        return text
-            except:
-                continue
+        compound, patterns = _compile_field_selectors(tuple(selectors))
+        if compound is None:
+            return None
+        
+        # One traversal collects every candidate; selector priority is then resolved
+        # over that short list, taking each selector's first match as select_one would
+        candidates = compound.select(element)
+        for pattern in patterns:
+            found = next((candidate for candidate in candidates if pattern.match(candidate)), None)
+            if found:
+                text = found.get_text().strip()
+                if text:
+                    return text
         return None
     
-    def filter_hvac_contracts(self, contracts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def filter_hvac_contracts(self, contracts: List[Dict[str, Any]], with_scores: bool = True) -> List[Dict[str, Any]]:
         """
         Filter contracts to only include relevant HVAC opportunities
         
         Args:
             contracts: List of contract dictionaries
+            with_scores: Set hvac_relevance_score/matching_keywords on kept contracts;
+                         when False only the keep/drop decision is made, which stops at
+                         the first signal
             
         Returns:
             Filtered list of HVAC contracts
@@ -853,35 +1472,70 @@ class BidNetSearcher:
         self.logger.info("Filtering contracts for HVAC relevance...")
         
         hvac_contracts = []
-        target_keywords = [kw.lower() for kw in Config.SEARCH_PARAMS["target_keywords"]]
-        negative_keywords = [kw.lower() for kw in Config.SEARCH_PARAMS["negative_keywords"]]
+        target_keywords = self.target_keywords
+        negative_keywords = self.negative_keywords
         
+        # The same listing often comes back under several search keywords; match it once
+        seen_keys = set()
+        unique_contracts = []
         for contract in contracts:
-            # Combine all text fields for analysis
-            text_content = ' '.join([
-                contract.get('title', ''),
-                contract.get('agency', ''),
-                contract.get('location', ''),
-                contract.get('raw_html', '')
-            ]).lower()
-            
+            key = _contract_dedup_key(contract)
+            if key not in seen_keys:
+                seen_keys.add(key)
+                unique_contracts.append(contract)
+        if len(unique_contracts) < len(contracts):
+            self.logger.info(f"Skipping {len(contracts) - len(unique_contracts)} duplicate contracts")
+        contracts = unique_contracts
+        
+        # Combined lowercase text per contract and the negative-keyword decision;
+        # large batches do both, plus the positive keyword matches, as pandas string ops
+        workers = min(os.cpu_count() or 1, len(contracts) // PARALLEL_FILTER_CHUNK_SIZE)
+        if len(contracts) >= PARALLEL_FILTER_MIN_CONTRACTS and workers > 1:
+            texts, excluded, positive_matches = self._hvac_texts_parallel(contracts, workers)
+        elif len(contracts) >= VECTORIZED_FILTER_MIN_CONTRACTS:
+            texts, excluded, positive_matches = self._hvac_texts_vectorized(contracts)
+        else:
+            texts = [self._hvac_text(contract) for contract in contracts]
+            excluded = [bool(self._negative_pattern.search(text)) for text in texts]
+            positive_matches = [None] * len(texts)  # Matched per contract below
+        
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        for contract, text_content, is_excluded, precomputed in zip(contracts, texts, excluded, positive_matches):
             self.logger.debug(f"\nAnalyzing: {contract.get('title', 'No title')[:100]}")
             
-            # Check for negative keywords first (exclude these)
-            matching_negative = [neg_kw for neg_kw in negative_keywords if neg_kw in text_content]
-            if matching_negative:
+            # Check for negative keywords first (exclude these); every matching keyword
+            # is only collected when debug logging will show them
+            if is_excluded:
+                if debug_enabled:
+                    matching_negative = _match_keywords(text_content, negative_keywords, self._negative_pattern)
+                else:
+                    first_negative = self._negative_pattern.search(text_content)
+                    matching_negative = [first_negative.group(0)] if first_negative else []
                 self.logger.info(f"Excluding '{contract.get('title', 'No title')[:50]}' due to: {matching_negative}")
                 continue
             
-            # Check for positive HVAC keywords (be more lenient)
-            matching_positive = [pos_kw for pos_kw in target_keywords if pos_kw in text_content]
-            
             # Also check if the search keyword is in the content (since we searched for HVAC terms)
             search_in_content = contract.get('search_keyword', '').lower() in text_content
             
-            if matching_positive or search_in_content:
-                contract['hvac_relevance_score'] = len(matching_positive)
-                contract['matching_keywords'] = matching_positive
+            # Check for positive HVAC keywords (be more lenient)
+            matching_positive = []
+            if precomputed is not None:
+                matching_positive = precomputed
+                is_relevant = bool(matching_positive) or search_in_content
+            elif not with_scores:
+                # Decision only: the search keyword or any single keyword hit is enough
+                is_relevant = search_in_content or bool(self._target_pattern.search(text_content))
+            else:
+                matching_positive = _match_keywords(text_content, target_keywords, self._target_pattern)
+                is_relevant = bool(matching_positive) or search_in_content
+            
+            if is_relevant:
+                if with_scores:
+                    contract['hvac_relevance_score'] = len(matching_positive)
+                    contract['matching_keywords'] = matching_positive
+                if contract.get('raw_html'):
+                    # Debug HTML is only ever shown as the Excel preview from here on
+                    contract['raw_html'] = contract['raw_html'][:RAW_HTML_PREVIEW_CHARS]
                 hvac_contracts.append(contract)
                 self.logger.info(f"✅ Kept '{contract.get('title', 'No title')[:50]}' - matches: {matching_positive}")
             else:
@@ -890,13 +1544,52 @@ class BidNetSearcher:
         self.logger.info(f"Filtered to {len(hvac_contracts)} HVAC-relevant contracts")
         return hvac_contracts
     
-    def _calculate_relevance_score(self, text: str, target_keywords: List[str]) -> int:
-        """Calculate relevance score based on keyword matches"""
-        score = 0
-        for keyword in target_keywords:
-            if keyword in text:
-                score += 1
-        return score
+    def _hvac_text(self, contract: Dict[str, Any]) -> str:
+        """Combine a contract's text fields into the lowercase text keywords are matched against"""
+        return _combined_lower_text(
+            contract.get('title', ''),
+            contract.get('agency', ''),
+            contract.get('location', ''),
+            contract.get('full_text', '')
+        )
+    
+    def _hvac_texts_parallel(self, contracts: List[Dict[str, Any]], workers: int):
+        """Match a very large batch in worker processes, PARALLEL_FILTER_CHUNK_SIZE texts per task"""
+        texts = [self._hvac_text(contract) for contract in contracts]
+        chunks = [texts[i:i + PARALLEL_FILTER_CHUNK_SIZE] for i in range(0, len(texts), PARALLEL_FILTER_CHUNK_SIZE)]
+        worker = partial(_match_texts_worker, target_keywords=self.target_keywords,
+                         negative_keywords=self.negative_keywords)
+        
+        excluded, positive_matches = [], []
+        with multiprocessing.Pool(processes=workers) as pool:
+            for chunk_excluded, chunk_matches in pool.imap(worker, chunks):
+                excluded.extend(chunk_excluded)
+                positive_matches.extend(chunk_matches)
+        return texts, excluded, positive_matches
+    
+    def _hvac_texts_vectorized(self, contracts: List[Dict[str, Any]]):
+        """
+        Build the combined texts, negative-keyword mask and positive keyword matches
+        for a large batch with pandas
+        
+        Each target keyword is one vectorized substring test over the whole batch;
+        the resulting contracts x keywords matrix gives every contract's match list.
+        """
+        import numpy as np
+        import pandas as pd
+        
+        df = pd.DataFrame(contracts, columns=['title', 'agency', 'location', 'full_text'])
+        text = (
+            df['title'].fillna('') + ' ' + df['agency'].fillna('') + ' ' +
+            df['location'].fillna('') + ' ' + df['full_text'].fillna('')
+        ).str.lower()
+        excluded = text.str.contains(self._negative_pattern, regex=True, na=False)
+        keywords = self.target_keywords
+        hit_matrix = np.column_stack(
+            [text.str.contains(keyword, regex=False, na=False).to_numpy(dtype=bool) for keyword in keywords]
+        ) if keywords else np.zeros((len(text), 0), dtype=bool)
+        positive_matches = [[keywords[j] for j in np.flatnonzero(row)] for row in hit_matrix]
+        return text.tolist(), excluded.tolist(), positive_matches
     
     def save_contracts_to_csv(self, contracts: List[Dict[str, Any]], filename: str = None):
         """Save contracts to CSV file"""
@@ -905,20 +1598,19 @@ class BidNetSearcher:
             return
             
         if filename is None:
-            timestamp = int(time.time())
+            timestamp = time.time_ns()  # Unique even for back-to-back exports
             filename = f"hvac_contracts_{timestamp}.csv"
             
         filepath = f"{Config.PROCESSED_DATA_DIR}/{filename}"
         
-        # Convert to DataFrame
-        df = pd.DataFrame(contracts)
+        # Columns in first-seen order across all contracts, minus raw_html (too long)
+        fieldnames = list(dict.fromkeys(key for contract in contracts for key in contract if key != 'raw_html'))
         
-        # Remove raw_html column for CSV (too long)
-        if 'raw_html' in df.columns:
-            df = df.drop('raw_html', axis=1)
-            
-        # Save to CSV
-        df.to_csv(filepath, index=False)
+        # Stream rows straight to CSV; no intermediate DataFrame
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(contracts)
         self.logger.info(f"Saved {len(contracts)} contracts to {filepath}")
         
         return filepath
@@ -930,54 +1622,92 @@ class BidNetSearcher:
             return
             
         if filename is None:
-            timestamp = int(time.time())
+            timestamp = time.time_ns()  # Unique even for back-to-back exports
             filename = f"hvac_contracts_{timestamp}.xlsx"
             
         filepath = f"{Config.PROCESSED_DATA_DIR}/{filename}"
         
-        # Prepare data for Excel
-        excel_data = []
-        for contract in contracts:
-            row = {
-                'Title': contract.get('title', 'No title'),
-                'Agency': contract.get('agency', 'Unknown'),
-                'Location': contract.get('location', 'Unknown'),
-                'Dates': contract.get('dates', 'No dates found'),
-                'Estimated_Value': contract.get('estimated_value', 'Not specified'),
-                'URL': contract.get('url', 'No URL'),
-                'Search_Keyword': contract.get('search_keyword', ''),
-                'HVAC_Relevance_Score': contract.get('hvac_relevance_score', 0),
-                'Matching_Keywords': ', '.join(contract.get('matching_keywords', [])),
-                'Contract_ID': contract.get('id', ''),
-                'Raw_HTML_Preview': contract.get('raw_html', '')[:300] + '...' if contract.get('raw_html') else ''
-            }
-            excel_data.append(row)
+        import pandas as pd  # Only needed for exports; keeps searcher import light
         
-        # Convert to DataFrame
-        df = pd.DataFrame(excel_data)
+        # Prepare data for Excel: one frame built column by column from only the exported
+        # fields, defaults filled per column
+        df = pd.DataFrame({field: [contract.get(field) for contract in contracts] for field in EXCEL_COLUMNS})
+        df = df.fillna({field: default for field, (_, default) in EXCEL_COLUMNS.items() if default is not None})
+        df['matching_keywords'] = df['matching_keywords'].map(', '.join, na_action='ignore').fillna('')
+        raw_html = df['raw_html'].fillna('').astype(str)
+        df['raw_html'] = (raw_html.str[:RAW_HTML_PREVIEW_CHARS] + '...').where(raw_html != '', '')
+        df = df.rename(columns={field: name for field, (name, _) in EXCEL_COLUMNS.items()})
         
-        # Save to Excel with formatting
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='HVAC Contracts', index=False)
-            
-            # Get the workbook and worksheet
-            workbook = writer.book
-            worksheet = writer.sheets['HVAC Contracts']
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                        
-                adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+        # Auto-adjust column widths from the DataFrame rather than reading cells back
+        widths = [
+            min(max(df[col].astype(str).str.len().max(), len(str(col))) + 2, 50)  # Cap at 50 characters
+            for col in df.columns
+        ]
+        
+        if XLSXWRITER_AVAILABLE:
+            # Values-only sheet streamed row by row; skips pandas' per-cell styling path.
+            # URLs stay plain strings as openpyxl writes them (and avoid the per-sheet link limit)
+            workbook = xlsxwriter.Workbook(filepath, {'constant_memory': True, 'strings_to_urls': False})
+            try:
+                worksheet = workbook.add_worksheet('HVAC Contracts')
+                bold = workbook.add_format({'bold': True})
+                for i, width in enumerate(widths):
+                    worksheet.set_column(i, i, width)
+                worksheet.write_row(0, 0, list(df.columns), bold)
+                for row_index, row in enumerate(df.itertuples(index=False, name=None), start=1):
+                    worksheet.write_row(row_index, 0, row)
+            finally:
+                workbook.close()
+        else:
+            from openpyxl.utils import get_column_letter
+            
+            # Save to Excel with formatting
+            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+                df.to_excel(writer, sheet_name='HVAC Contracts', index=False)
+                worksheet = writer.sheets['HVAC Contracts']
+                for i, width in enumerate(widths):
+                    worksheet.column_dimensions[get_column_letter(i + 1)].width = width
         
         self.logger.info(f"Saved {len(contracts)} contracts to Excel file: {filepath}")
-        return filepath
\ No newline at end of file
+        return filepath
+
+# Rate limiter shared with the parent searcher, set in each worker process by _init_search_worker
+_worker_rate_limiter = None
+
+def _init_search_worker(rate_limiter: RateLimiter):
+    """Pool initializer: adopt the parent searcher's (shared-memory) rate limiter"""
+    global _worker_rate_limiter
+    _worker_rate_limiter = rate_limiter
+
+def _search_keyword_worker(keyword: str, location_filters: List[str]) -> List[Dict[str, Any]]:
+    """Search one keyword in a worker process with its own browser, starting from the saved login"""
+    searcher = BidNetSearcher()
+    searcher._persist_login = False  # Only the parent process writes the saved session
+    if _worker_rate_limiter is not None:
+        searcher._search_rate_limiter = _worker_rate_limiter
+    searcher._search_rate_limiter.acquire()
+    searcher.logger.info(f"Searching for: {keyword}")
+    try:
+        return searcher.search_with_browser(keyword, location_filters)
+    finally:
+        searcher.cleanup()
+
+def _match_texts_worker(texts: List[str], target_keywords: Tuple[str, ...],
+                        negative_keywords: Tuple[str, ...]):
+    """Negative-keyword flags and positive keyword matches for a chunk of lowered texts"""
+    target_keywords, target_pattern = _normalize_keywords(target_keywords)
+    negative_keywords, negative_pattern = _normalize_keywords(negative_keywords)
+    excluded = [bool(negative_pattern.search(text)) for text in texts]
+    matches = [
+        [] if is_excluded else _match_keywords(text, target_keywords, target_pattern)
+        for text, is_excluded in zip(texts, excluded)
+    ]
+    return excluded, matches
+
+def _write_gzip_text(path: str, text: str):
+    """Write text gzip-compressed; level 1 still shrinks HTML several times over"""
+    try:
+        with gzip.open(path, 'wt', encoding='utf-8', compresslevel=1) as f:
+            f.write(text)
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"Could not write debug dump {path}: {e}")
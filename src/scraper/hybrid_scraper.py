@@ -1,5 +1,7 @@
 import logging
+import hashlib
 import json
+import re
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import time
@@ -14,6 +16,24 @@ from ..ai_agents.browser_agent import BrowserUseAgent
 from ..processing.queue_manager import QueueManager
 from .bidnet_search import BidNetSearcher
 
+# Patterns for pulling a city name out of agency or location text, compiled once
+CITY_NAME_PATTERNS = (
+    re.compile(r'(?i)city of ([^,\n]+)'),
+    re.compile(r'(?i)([^,\n]+) city'),
+    re.compile(r'(?i)([^,\n]+),\s*ca'),
+    re.compile(r'(?i)([^,\n]+),\s*california'),
+)
+
+# Listing fields an id-less contract is identified by (raw_data gains other keys once saved)
+_CONTENT_ID_FIELDS = ('title', 'agency', 'location', 'url', 'full_text')
+
+def _contract_external_id(contract_data: Dict[str, Any]) -> str:
+    """The listing's own id, or one derived from its content (external_id can't be null)"""
+    if contract_data.get('id'):
+        return contract_data['id']
+    content = json.dumps([contract_data.get(field) for field in _CONTENT_ID_FIELDS], default=str)
+    return f"bidnet_{hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()}"
+
 class HybridScraper:
     """
     Hybrid AI + Traditional scraper that combines:
@@ -137,8 +157,8 @@ class HybridScraper:
         """
         self.logger.info(f"🤖 Processing AI queue batch (size: {batch_size})")
         
-        # Get pending AI analysis tasks
-        pending_tasks = self.queue_manager.get_pending_tasks("ai_analysis", batch_size)
+        # Claim pending AI analysis tasks (marks them in progress)
+        pending_tasks = self.queue_manager.claim_tasks(batch_size, "ai_analysis")
         
         results = {
             "processed": 0,
@@ -149,8 +169,6 @@ class HybridScraper:
         }
         
         for task in pending_tasks:
-            self.queue_manager.mark_task_started(task.id)
-            
             try:
                 # Process the contract
                 contract_id = task.config_data.get("contract_id")
@@ -232,21 +250,29 @@ class HybridScraper:
         saved_contracts = []
         
         with db_manager.get_session() as session:
-            for contract_data in contracts:
-                # Check if contract already exists
-                existing = session.query(Contract).filter(
-                    Contract.external_id == contract_data.get('id')
-                ).first()
-                
-                if existing:
+            # Contracts without an id each get a content-derived one, so they're kept apart
+            keyed_contracts = [(_contract_external_id(contract_data), contract_data) for contract_data in contracts]
+            
+            # One query for every incoming id that is already stored
+            incoming_ids = {external_id for external_id, _ in keyed_contracts}
+            seen_ids = {
+                external_id for (external_id,) in session.query(Contract.external_id).filter(
+                    Contract.external_id.in_(incoming_ids)
+                )
+            } if incoming_ids else set()
+            
+            for external_id, contract_data in keyed_contracts:
+                # Skip contracts already stored (or already added from this batch)
+                if external_id in seen_ids:
                     continue
+                seen_ids.add(external_id)
                 
                 # Determine geographic region
                 location = contract_data.get('location', '')
                 is_in_region, region = self.geo_filter.is_in_target_region(location)
                 
                 contract = Contract(
-                    external_id=contract_data.get('id'),
+                    external_id=external_id,
                     source_type=SourceType.BIDNET,
                     source_url=contract_data.get('url'),
                     title=contract_data.get('title', 'No title'),
@@ -265,9 +291,10 @@ class HybridScraper:
                     contract.raw_data = {}
                 contract.raw_data['in_target_region'] = is_in_region
                 
-                session.add(contract)
                 saved_contracts.append(contract)
             
+            # Inserted together at commit instead of one flush per contract
+            session.add_all(saved_contracts)
             session.commit()
         
         return saved_contracts
@@ -345,18 +372,8 @@ class HybridScraper:
         if not text:
             return "Unknown"
         
-        # Common patterns for city names
-        import re
-        
-        patterns = [
-            r'(?i)city of ([^,\n]+)',
-            r'(?i)([^,\n]+) city',
-            r'(?i)([^,\n]+),\s*ca',
-            r'(?i)([^,\n]+),\s*california'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in CITY_NAME_PATTERNS:
+            match = pattern.search(text)
             if match:
                 city_name = match.group(1).strip()
                 if len(city_name) > 2:  # Avoid single letters
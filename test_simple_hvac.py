@@ -26,7 +26,10 @@ def test_hvac_search():
     print("🔍 Searching for 'HVAC' contracts...")
     
     # Search for just "HVAC"
-    contracts = searcher.search_with_browser("HVAC", [])
+    try:
+        contracts = searcher.search_with_browser("HVAC", [])
+    finally:
+        searcher.cleanup()
     
     print(f"\n✅ Found {len(contracts)} total contracts")
     